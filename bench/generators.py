@@ -0,0 +1,87 @@
+import random
+from typing import List, Optional
+from memory.semantic.consolidate import consolidate
+from memory.semantic.memory import SemanticMemory
+from perception.events import Event
+from world.entities import Entity
+from world.model import WorldModel
+
+
+def make_world(
+    n_entities: int,
+    person_ratio: float = 0.1,
+    seed: int = 0,
+    into: Optional[WorldModel] = None,
+) -> WorldModel:
+    """
+    Project-Ordis plus n_entities persons/files, every file linked part_of.
+    Built in memory unless `into` (e.g. a WorldModel with temp paths) is given.
+    """
+    rng = random.Random(seed)
+    wm = into if into is not None else WorldModel(state_path=None, journal_path=None)
+    project_id = wm.add_entity(Entity(type="project", name="Project-Ordis"))
+    for i in range(n_entities):
+        if rng.random() < person_ratio:
+            wm.add_entity(Entity(type="person", name=f"person_{i}"))
+        else:
+            meta = {"path": f"/inbox/file_{i}.txt"}
+            fid = wm.add_entity(Entity(type="file", name=f"file_{i}.txt", meta=meta))
+            wm.upsert_relation(type="part_of", src=fid, dst=project_id)
+    return wm
+
+
+def make_facts(
+    wm: WorldModel, missing_ratio: float = 0.0, seed: int = 0
+) -> SemanticMemory:
+    """Semantic memory consolidated from wm, optionally with facts knocked out."""
+    sm = SemanticMemory(state_path=None)
+    consolidate(wm, sm)
+    if missing_ratio > 0:
+        rng = random.Random(seed)
+        keep = SemanticMemory(state_path=None)
+        for f in sm.facts.values():
+            if rng.random() >= missing_ratio:
+                keep.add_fact(f)
+        sm = keep
+    return sm
+
+
+def chat_burst(n: int, n_users: int = 10, seed: int = 0) -> List[Event]:
+    rng = random.Random(seed)
+    return [
+        Event(
+            event_type="chat",
+            source=f"user_{rng.randrange(n_users)}",
+            payload={"text": f"message {i}"},
+            meta={"channel": "bench"},
+        )
+        for i in range(n)
+    ]
+
+
+def file_burst(
+    n: int, content_bytes: int = 1024, distinct_files: int = 0, seed: int = 0
+) -> List[Event]:
+    """
+    n file events; distinct_files > 0 re-drops that many names round-robin
+    (exercises the update/dedup paths), otherwise every file is new.
+    """
+    rng = random.Random(seed)
+    events = []
+    for i in range(n):
+        k = i % distinct_files if distinct_files else i
+        body = "".join(rng.choice("abcdefgh \n") for _ in range(64))
+        content = (body * (content_bytes // len(body) + 1))[:content_bytes]
+        events.append(
+            Event(
+                event_type="file",
+                source="inbox_scan",
+                payload={
+                    "path": f"/inbox/bench_{k}.txt",
+                    "name": f"bench_{k}.txt",
+                    "content": content,
+                },
+                meta={"ext": ".txt"},
+            )
+        )
+    return events
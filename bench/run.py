@@ -0,0 +1,227 @@
+"""
+Kernel pipeline benchmarks.
+
+    python -m bench.run --scales 1000,10000 --out bench_results.json
+
+Every benchmark runs against synthetic state in a temporary directory, never
+the real memory/world/eval files. Results are a single JSON document keyed by
+scale so runs from different commits can be diffed directly.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+from bench.generators import chat_burst, file_burst, make_facts, make_world
+from eval.coherence import CoherenceEvaluator, run_coherence_eval
+from kernel.config import KernelConfig
+from kernel.kernel import Kernel
+from memory.semantic.consolidate import consolidate
+from memory.semantic.memory import SemanticMemory
+from world.model import WorldModel
+from world.update_rules import apply_event
+
+
+@contextlib.contextmanager
+def isolated_state() -> Iterator[KernelConfig]:
+    """A KernelConfig rooted in a fresh temp dir, removed afterwards."""
+    with tempfile.TemporaryDirectory(prefix="ordis-bench-") as tmp:
+        yield KernelConfig.at(Path(tmp))
+
+
+def _timed(fn: Callable[[], Any], repeat: int = 3) -> Dict[str, float]:
+    runs: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return {"min_s": min(runs), "median_s": statistics.median(runs)}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def bench_apply_event(scale: int, burst: int) -> Dict[str, Any]:
+    wm = make_world(scale)
+    files = file_burst(burst - burst // 2, distinct_files=max(1, burst // 4))
+    events = chat_burst(burst // 2) + files
+    start = time.perf_counter()
+    for ev in events:
+        apply_event(wm, ev)
+    elapsed = time.perf_counter() - start
+    return {
+        "events": len(events),
+        "seconds": elapsed,
+        "events_per_s": len(events) / elapsed,
+    }
+
+
+def bench_consolidate(scale: int) -> Dict[str, Any]:
+    wm = make_world(scale)
+    out: Dict[str, Any] = {}
+    out["full_cold"] = _timed(lambda: consolidate(wm, SemanticMemory()), repeat=1)
+    sm = make_facts(wm)
+    out["full_warm"] = _timed(lambda: consolidate(wm, sm))
+    feed = wm.open_change_feed()
+    feed.drain()
+    for ev in file_burst(100):
+        apply_event(wm, ev)
+    delta = feed.drain()
+    out["delta_100_events"] = _timed(lambda: consolidate(wm, sm, delta), repeat=1)
+    return out
+
+
+def bench_coherence(scale: int) -> Dict[str, Any]:
+    wm = make_world(scale)
+    sm = make_facts(wm, missing_ratio=0.05)
+    out: Dict[str, Any] = {"full": _timed(lambda: run_coherence_eval(wm, sm))}
+    ev = CoherenceEvaluator(wm, sm)
+    out["incremental_first"] = _timed(ev.evaluate, repeat=1)
+    for e in file_burst(100):
+        apply_event(wm, e)
+    consolidate(wm, sm)
+    out["incremental_after_100_events"] = _timed(ev.evaluate, repeat=1)
+    out["incremental_idle"] = _timed(ev.evaluate)
+    return out
+
+
+def bench_persistence(scale: int) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    with isolated_state() as cfg:
+        wm = make_world(
+            scale, into=WorldModel(cfg.world_state_path, cfg.world_journal_path)
+        )
+        out["world_save_full"] = _timed(wm.save, repeat=1)
+        out["world_compact"] = _timed(wm.compact, repeat=1)
+        out["world_load"] = _timed(
+            lambda: WorldModel.load(cfg.world_state_path, cfg.world_journal_path),
+            repeat=1,
+        )
+        for ev in file_burst(100):
+            apply_event(wm, ev)
+        out["world_save_100_changes"] = _timed(wm.save, repeat=1)
+
+        sm = make_facts(wm)
+        sm.state_path = cfg.semantic_state_path
+        sm.journal_path = cfg.semantic_journal_path
+        out["semantic_save"] = _timed(sm.save, repeat=1)
+        out["semantic_load"] = _timed(
+            lambda: SemanticMemory.load(
+                cfg.semantic_state_path, cfg.semantic_journal_path
+            ),
+            repeat=1,
+        )
+    return out
+
+
+def bench_kernel_step(scale: int, burst: int, ticks: int) -> Dict[str, Any]:
+    with isolated_state() as cfg:
+        wm = make_world(
+            scale, into=WorldModel(cfg.world_state_path, cfg.world_journal_path)
+        )
+        wm.compact()
+        sm = make_facts(wm)
+        sm.state_path = cfg.semantic_state_path
+        sm.journal_path = cfg.semantic_journal_path
+        sm.save()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            k = Kernel(cfg)
+            startup = time.perf_counter() - start
+            try:
+                for ev in chat_burst(burst // 2) + file_burst(burst - burst // 2):
+                    k.ingest_event(ev, force=True)
+                latencies = []
+                for _ in range(ticks):
+                    t0 = time.perf_counter()
+                    k.step()
+                    latencies.append(time.perf_counter() - t0)
+            finally:
+                k.shutdown()
+
+    # the first tick drains the burst; later ticks are steady-state heartbeats
+    return {
+        "startup_s": startup,
+        "ticks": ticks,
+        "first_tick_s": latencies[0],
+        "steady_p50_s": statistics.median(latencies[1:]) if ticks > 1 else None,
+        "max_s": max(latencies),
+    }
+
+
+def run(scales: List[int], burst: int, ticks: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {
+        "meta": {
+            "ts": datetime.utcnow().isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "burst": burst,
+            "ticks": ticks,
+        },
+        "scales": {},
+    }
+    for scale in scales:
+        print(f"[bench] scale={scale}", file=sys.stderr)
+        results["scales"][str(scale)] = {
+            "apply_event": bench_apply_event(scale, burst),
+            "consolidate": bench_consolidate(scale),
+            "coherence": bench_coherence(scale),
+            "persistence": bench_persistence(scale),
+            "kernel_step": bench_kernel_step(scale, burst, ticks),
+            "peak_rss_mb": _peak_rss_mb(),
+        }
+    return results
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Ordis kernel pipeline."
+    )
+    parser.add_argument(
+        "--scales", default="1000,10000", help="comma-separated entity counts"
+    )
+    parser.add_argument(
+        "--burst", type=int, default=1000, help="events per ingest burst"
+    )
+    parser.add_argument("--ticks", type=int, default=5, help="kernel ticks to time")
+    parser.add_argument("--out", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s]
+    results = run(scales, args.burst, args.ticks)
+    text = json.dumps(results, indent=2)
+    if args.out:
+        Path(args.out).write_text(text, encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
-from typing import List
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from .records import EvalRecord
-from world.model import WorldModel
+from world.model import EntityRef, WorldModel
+from memory.semantic.columnar import FactColumns, use_columnar
 from memory.semantic.memory import SemanticMemory
 
 
@@ -10,22 +11,32 @@ def run_coherence_eval(wm: WorldModel, sm: SemanticMemory) -> EvalRecord:
     passed = 0
 
     # find Project-Ordis id if present
-    proj = wm.find_entities(type="project", name="Project-Ordis")
+    proj = wm.find_entity_refs(type="project", name="Project-Ordis")
     project_id = proj[0].id if proj else None
 
+    if use_columnar(len(wm.entities)):
+        checks = _columnar_checks(wm, sm, project_id)
+        notes = [
+            n
+            for eid in checks.failing()
+            for n in _check_entity(wm.get_entity_ref(eid), sm, project_id)[2]
+        ]
+        score = (checks.passed / checks.total) if checks.total > 0 else 1.0
+        return EvalRecord(eval_type="coherence_v0", score=score, notes=notes)
+
     # persons must have is_a person
-    for p in wm.find_entities(type="person"):
+    for p in wm.find_entity_refs(type="person"):
         total += 1
-        ok = bool(sm.find_facts(subject=p.id, predicate="is_a", object="person"))
+        ok = sm.exists(subject=p.id, predicate="is_a", object="person")
         if ok:
             passed += 1
         else:
             notes.append(f"missing fact: {p.name} is_a person")
 
     # files must have is_a file
-    for f in wm.find_entities(type="file"):
+    for f in wm.find_entity_refs(type="file"):
         total += 1
-        ok = bool(sm.find_facts(subject=f.id, predicate="is_a", object="file"))
+        ok = sm.exists(subject=f.id, predicate="is_a", object="file")
         if ok:
             passed += 1
         else:
@@ -34,9 +45,7 @@ def run_coherence_eval(wm: WorldModel, sm: SemanticMemory) -> EvalRecord:
         # files must be part_of Project-Ordis
         if project_id:
             total += 1
-            ok2 = bool(
-                sm.find_facts(subject=f.id, predicate="part_of", object=project_id)
-            )
+            ok2 = sm.exists(subject=f.id, predicate="part_of", object=project_id)
             if ok2:
                 passed += 1
             else:
@@ -45,3 +54,178 @@ def run_coherence_eval(wm: WorldModel, sm: SemanticMemory) -> EvalRecord:
     score = (passed / total) if total > 0 else 1.0
 
     return EvalRecord(eval_type="coherence_v0", score=score, notes=notes)
+
+
+class CoherenceDivergence(RuntimeError):
+    """Incremental and full coherence passes disagree (differential mode)."""
+
+
+# Per-entity verdict: (checks run, checks passed, notes for failed checks)
+_Verdict = Tuple[int, int, List[str]]
+_NO_CHECKS: _Verdict = (0, 0, [])
+
+
+def _check_entity(
+    e: EntityRef, sm: SemanticMemory, project_id: Optional[str]
+) -> _Verdict:
+    """The same checks run_coherence_eval applies to one entity."""
+    if e.type == "person":
+        if sm.exists(subject=e.id, predicate="is_a", object="person"):
+            return (1, 1, [])
+        return (1, 0, [f"missing fact: {e.name} is_a person"])
+
+    if e.type == "file":
+        total, passed, notes = 1, 0, []
+        if sm.exists(subject=e.id, predicate="is_a", object="file"):
+            passed += 1
+        else:
+            notes.append(f"missing fact: {e.name} is_a file")
+        if project_id:
+            total += 1
+            if sm.exists(subject=e.id, predicate="part_of", object=project_id):
+                passed += 1
+            else:
+                notes.append(f"missing fact: {e.name} part_of Project-Ordis")
+        return (total, passed, notes)
+
+    return _NO_CHECKS
+
+
+class _ColumnarChecks(NamedTuple):
+    """The checks above for every person and file at once (bool masks)."""
+
+    persons: List[str]
+    person_ok: Any
+    files: List[str]
+    file_ok: Any  # is_a file and, with a project, part_of it
+    total: int
+    passed: int
+
+    def failing(self) -> List[str]:
+        """Ids of entities with a failed check, in full-pass order."""
+        bad_persons = (~self.person_ok).nonzero()[0].tolist()
+        bad_files = (~self.file_ok).nonzero()[0].tolist()
+        return [self.persons[i] for i in bad_persons] + [
+            self.files[i] for i in bad_files
+        ]
+
+
+def _columnar_checks(
+    wm: WorldModel, sm: SemanticMemory, project_id: Optional[str]
+) -> _ColumnarChecks:
+    cols = FactColumns(sm)
+    persons = wm.find_entity_ids(type="person")
+    files = wm.find_entity_ids(type="file")
+    person_ok = cols.has(cols.term_ids(persons), "is_a", "person")
+    file_terms = cols.term_ids(files)
+    file_isa = cols.has(file_terms, "is_a", "file")
+    total = len(persons) + len(files)
+    passed = int(person_ok.sum()) + int(file_isa.sum())
+    file_ok = file_isa
+    if project_id:
+        file_part = cols.has(file_terms, "part_of", project_id)
+        total += len(files)
+        passed += int(file_part.sum())
+        file_ok = file_isa & file_part
+    return _ColumnarChecks(persons, person_ok, files, file_ok, total, passed)
+
+
+class CoherenceEvaluator:
+    """
+    Incremental coherence_v0. Keeps a verdict per entity and running
+    passed/total counts; each evaluate() re-checks only entities touched in
+    the world or whose facts changed since the previous call.
+
+    verify=True also runs the full pass and raises CoherenceDivergence if
+    the score or the (sorted) notes differ.
+    """
+
+    def __init__(self, wm: WorldModel, sm: SemanticMemory, verify: bool = False):
+        self.wm = wm
+        self.sm = sm
+        self.verify = verify
+        self._world_feed = wm.open_change_feed()
+        self._fact_feed = sm.open_change_feed()
+        self._verdicts: Dict[str, _Verdict] = {}
+        self._failing: Dict[str, None] = {}  # ordered set of entity ids
+        self._project_id: Optional[str] = None
+        self.total = 0
+        self.passed = 0
+
+    def _set_verdict(self, entity_id: str, verdict: _Verdict):
+        old = self._verdicts.pop(entity_id, _NO_CHECKS)
+        self.total -= old[0]
+        self.passed -= old[1]
+        self._failing.pop(entity_id, None)
+
+        if verdict[0]:
+            self._verdicts[entity_id] = verdict
+            self.total += verdict[0]
+            self.passed += verdict[1]
+            if verdict[1] < verdict[0]:
+                self._failing[entity_id] = None
+
+    def _rebuild(self, project_id: Optional[str]):
+        self._verdicts = {}
+        self._failing = {}
+        self.total = 0
+        self.passed = 0
+        if use_columnar(len(self.wm.entities)):
+            self._rebuild_columnar(project_id)
+            return
+        persons = self.wm.find_entity_refs(type="person")
+        for e in persons + self.wm.find_entity_refs(type="file"):
+            self._set_verdict(e.id, _check_entity(e, self.sm, project_id))
+
+    def _rebuild_columnar(self, project_id: Optional[str]):
+        checks = _columnar_checks(self.wm, self.sm, project_id)
+        # passing entities share one verdict tuple; only failures get notes
+        file_checks = 2 if project_id else 1
+        self._verdicts = dict.fromkeys(checks.persons, (1, 1, []))
+        self._verdicts.update(
+            dict.fromkeys(checks.files, (file_checks, file_checks, []))
+        )
+        for eid in checks.failing():
+            e = self.wm.get_entity_ref(eid)
+            self._verdicts[eid] = _check_entity(e, self.sm, project_id)
+            self._failing[eid] = None
+        self.total = checks.total
+        self.passed = checks.passed
+
+    def evaluate(self) -> EvalRecord:
+        proj = self.wm.find_entity_refs(type="project", name="Project-Ordis")
+        project_id = proj[0].id if proj else None
+
+        world = self._world_feed.drain()
+        facts_full, subjects = self._fact_feed.drain()
+
+        if world.full or facts_full or project_id != self._project_id:
+            # a different project changes the part_of check of every file
+            self._rebuild(project_id)
+        else:
+            for eid in dict.fromkeys(world.entities + subjects):
+                e = self.wm.get_entity_ref(eid)
+                verdict = _check_entity(e, self.sm, project_id) if e else _NO_CHECKS
+                self._set_verdict(eid, verdict)
+        self._project_id = project_id
+
+        notes = [n for eid in self._failing for n in self._verdicts[eid][2]]
+        score = (self.passed / self.total) if self.total > 0 else 1.0
+        record = EvalRecord(eval_type="coherence_v0", score=score, notes=notes)
+
+        if self.verify:
+            full = run_coherence_eval(self.wm, self.sm)
+            if full.score != record.score:
+                raise CoherenceDivergence(
+                    f"incremental score {record.score} != full score {full.score}"
+                )
+            # notes come out in a different order (failing set vs. entity scan)
+            inc_notes, full_notes = sorted(record.notes), sorted(full.notes)
+            if inc_notes != full_notes:
+                only_inc = [n for n in inc_notes if n not in full_notes]
+                only_full = [n for n in full_notes if n not in inc_notes]
+                raise CoherenceDivergence(
+                    f"incremental notes differ from full pass: "
+                    f"{only_inc[:5]} only incremental, {only_full[:5]} only full"
+                )
+        return record
@@ -9,4 +9,15 @@ class EvalRecord(BaseModel):
     eval_type: str
     score: float
     notes: List[str] = []
-    evidence_ids: Optional[List[int]] = None
\ No newline at end of file
+    evidence_ids: Optional[List[int]] = None
+
+class EvalRollup(BaseModel):
+    """Downsampled scores of one eval_type over one time bucket."""
+
+    eval_type: str
+    bucket_start: str  # ISO timestamp, aligned to bucket_seconds
+    bucket_seconds: int
+    count: int
+    min: float
+    mean: float
+    max: float
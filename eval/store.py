@@ -1,35 +1,273 @@
 import json
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
-from .records import EvalRecord
+from typing import Dict, Iterator, List, Optional, Tuple
+from .records import EvalRecord, EvalRollup
 
+# Legacy whole-history snapshot; migrated into the append-only log on load.
 EVAL_STATE_PATH = Path(__file__).parent / "eval_state.json"
+# Raw records, one JSON object per line, appended on save().
+EVAL_LOG_PATH = Path(__file__).parent / "eval_records.jsonl"
+# Downsampled min/mean/max buckets for records past raw retention.
+EVAL_ROLLUP_PATH = Path(__file__).parent / "eval_rollups.jsonl"
+
+# Keep raw records this long, then fold them into rollup buckets.
+EVAL_RAW_RETENTION_HOURS = 24
+EVAL_ROLLUP_BUCKET_SECONDS = 3600
+
+
+def _parse_ts(ts: str) -> datetime:
+    return datetime.fromisoformat(ts)
+
+
+def _bucket_start(ts: datetime, bucket_seconds: int) -> datetime:
+    epoch = datetime(1970, 1, 1, tzinfo=ts.tzinfo)
+    secs = int((ts - epoch).total_seconds())
+    return epoch + timedelta(seconds=secs - secs % bucket_seconds)
+
+
+def _in_range(ts: str, start: Optional[datetime], end: Optional[datetime]) -> bool:
+    t = _parse_ts(ts)
+    if start is not None and t < start:
+        return False
+    if end is not None and t >= end:
+        return False
+    return True
+
+
+def _range(
+    start: Optional[str], end: Optional[str]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    return (
+        _parse_ts(start) if start is not None else None,
+        _parse_ts(end) if end is not None else None,
+    )
+
+
+def _append_lines(path: Path, lines: List[str]) -> int:
+    """Append lines durably; returns the number of bytes written."""
+    data = ("\n".join(lines) + "\n").encode("utf-8")
+    with open(path, "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    return len(data)
+
+
+def _dump(m) -> Dict:
+    return m.model_dump() if hasattr(m, "model_dump") else m.dict()
+
+
+def _load_record(cls, data: Dict):
+    """Trusted record from our own log; v1 skips validation."""
+    if hasattr(cls, "model_validate"):
+        return cls.model_validate(data)
+    return cls.construct(**data)
+
 
 class EvalStore:
-    def __init__(self):
+    """
+    Append-only eval history. Only raw records inside the retention window
+    are held in memory; older ones are downsampled into EvalRollup buckets.
+    """
+
+    def __init__(
+        self,
+        log_path: Optional[Path] = EVAL_LOG_PATH,
+        rollup_path: Optional[Path] = EVAL_ROLLUP_PATH,
+        raw_retention_hours: float = EVAL_RAW_RETENTION_HOURS,
+        bucket_seconds: int = EVAL_ROLLUP_BUCKET_SECONDS,
+    ):
+        # None paths => purely in-memory (rollups are then kept in a list)
+        self.log_path = log_path
+        self.rollup_path = rollup_path
+        self._memory_rollups: List[EvalRollup] = []
         self.records: Dict[str, EvalRecord] = {}
+        self.raw_retention = timedelta(hours=raw_retention_hours)
+        self.bucket_seconds = bucket_seconds
+        self._pending: List[EvalRecord] = []
+        self.bytes_written = 0  # cumulative, for tick I/O metrics
 
     def add_record(self, r: EvalRecord) -> str:
         self.records[r.id] = r
+        self._pending.append(r)
         return r.id
 
     def list_records(self) -> List[EvalRecord]:
         return list(self.records.values())
 
+    # ---- persistence ----
     def save(self):
-        data = [
-            r.model_dump() if hasattr(r, "model_dump") else r.dict()
-            for r in self.records.values()
+        """Append records added since the last save; compact when due."""
+        if self._pending:
+            if self.log_path is not None:
+                lines = [json.dumps(_dump(r)) for r in self._pending]
+                self.bytes_written += _append_lines(self.log_path, lines)
+            self._pending = []
+
+        # Compaction only folds whole buckets, so run it once the oldest raw
+        # record is a full bucket past retention rather than on every save.
+        oldest = next(iter(self.records.values()), None)
+        if oldest is not None and _parse_ts(oldest.ts) < self._cutoff(
+            datetime.utcnow() - timedelta(seconds=self.bucket_seconds)
+        ):
+            self.compact()
+
+    def _cutoff(self, now: datetime) -> datetime:
+        return _bucket_start(now - self.raw_retention, self.bucket_seconds)
+
+    def compact(self, now: Optional[datetime] = None):
+        """
+        Fold raw records older than the retention cutoff into rollup buckets
+        and rewrite the raw log with what remains. The cutoff is bucket-aligned
+        so every bucket is written exactly once.
+        """
+        if self._pending:
+            self.save()
+        cutoff = self._cutoff(now or datetime.utcnow())
+
+        buckets: Dict[Tuple[str, datetime], List[float]] = {}
+        keep: Dict[str, EvalRecord] = {}
+        for r in self.records.values():
+            t = _parse_ts(r.ts)
+            if t < cutoff:
+                key = (r.eval_type, _bucket_start(t, self.bucket_seconds))
+                buckets.setdefault(key, []).append(r.score)
+            else:
+                keep[r.id] = r
+        if not buckets:
+            return
+
+        rollups = [
+            EvalRollup(
+                eval_type=eval_type,
+                bucket_start=start.isoformat(),
+                bucket_seconds=self.bucket_seconds,
+                count=len(scores),
+                min=min(scores),
+                mean=sum(scores) / len(scores),
+                max=max(scores),
+            )
+            for (eval_type, start), scores in sorted(buckets.items())
         ]
-        EVAL_STATE_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        if self.rollup_path is not None:
+            lines = [json.dumps(_dump(x)) for x in rollups]
+            self.bytes_written += _append_lines(self.rollup_path, lines)
+        else:
+            self._memory_rollups.extend(rollups)
+
+        # rollups first: a crash before the rewrite leaves raw records that
+        # load() recognizes as already rolled up and skips.
+        if self.log_path is not None:
+            tmp = self.log_path.with_name(self.log_path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                for r in keep.values():
+                    line = (json.dumps(_dump(r)) + "\n").encode("utf-8")
+                    f.write(line)
+                    self.bytes_written += len(line)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.log_path)
+        self.records = keep
 
     @classmethod
-    def load(cls):
-        es = cls()
-        if not EVAL_STATE_PATH.exists():
-            return es
-        data = json.loads(EVAL_STATE_PATH.read_text(encoding="utf-8"))
-        for d in data:
-            r = EvalRecord(**d)
-            es.records[r.id] = r
-        return es
\ No newline at end of file
+    def load(
+        cls,
+        log_path: Optional[Path] = EVAL_LOG_PATH,
+        rollup_path: Optional[Path] = EVAL_ROLLUP_PATH,
+        legacy_path: Optional[Path] = EVAL_STATE_PATH,
+    ):
+        es = cls(log_path, rollup_path)
+        if (
+            log_path is not None
+            and legacy_path is not None
+            and not log_path.exists()
+            and legacy_path.exists()
+        ):
+            # one-time migration from the legacy whole-file snapshot
+            data = json.loads(legacy_path.read_text(encoding="utf-8"))
+            if data:
+                _append_lines(log_path, [json.dumps(d) for d in data])
+            else:
+                log_path.touch()
+            legacy_path.replace(legacy_path.with_suffix(".json.migrated"))
+
+        rolled = {(x.eval_type, x.bucket_start) for x in es._iter_rollups()}
+        for r in es._iter_log():
+            t = _parse_ts(r.ts)
+            key = (r.eval_type, _bucket_start(t, es.bucket_seconds).isoformat())
+            if key not in rolled:
+                es.records[r.id] = r
+        return es
+
+    def _iter_log(self) -> Iterator[EvalRecord]:
+        if self.log_path is None or not self.log_path.exists():
+            return
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield _load_record(EvalRecord, json.loads(line))
+                except json.JSONDecodeError:
+                    break  # torn tail from a crash mid-append
+
+    def _iter_rollups(self) -> Iterator[EvalRollup]:
+        if self.rollup_path is None:
+            yield from self._memory_rollups
+            return
+        if not self.rollup_path.exists():
+            return
+        with open(self.rollup_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield _load_record(EvalRollup, json.loads(line))
+                except json.JSONDecodeError:
+                    break
+
+    # ---- queries ----
+    def query(
+        self,
+        eval_type: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[EvalRecord]:
+        """Raw records (still in retention) for eval_type within [start, end)."""
+        start_t, end_t = _range(start, end)
+        return [
+            r
+            for r in self.records.values()
+            if (eval_type is None or r.eval_type == eval_type)
+            and _in_range(r.ts, start_t, end_t)
+        ]
+
+    def rollups(
+        self,
+        eval_type: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[EvalRollup]:
+        """Downsampled buckets whose start lies within [start, end)."""
+        start_t, end_t = _range(start, end)
+        return [
+            x
+            for x in self._iter_rollups()
+            if (eval_type is None or x.eval_type == eval_type)
+            and _in_range(x.bucket_start, start_t, end_t)
+        ]
+
+    def score_series(
+        self,
+        eval_type: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """(ts, score) points: bucket means for old history, then raw scores."""
+        rollups = self.rollups(eval_type, start, end)
+        points = [(x.bucket_start, x.mean) for x in rollups]
+        points.extend((r.ts, r.score) for r in self.query(eval_type, start, end))
+        points.sort(key=lambda p: _parse_ts(p[0]))
+        return points
@@ -0,0 +1,217 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional
+
+from kernel.scheduler import TickStats
+from perception.file_ingest import InboxStream
+from perception.inbox_watcher import InboxWatcher, InotifyWatcher
+from perception.text_ingest import ingest_chat
+
+# Without a fixed rate, tick at least this often even when no input arrives
+ASYNC_IDLE_TICK_SECONDS = 5.0
+# Inbox files taken from the watcher at a time; the rest wait in the watcher
+ASYNC_MAX_FILES_PER_TICK = 100
+
+Source = Callable[["AsyncRuntime"], Awaitable[None]]
+
+
+class AsyncRuntime:
+    """
+    Runs a Kernel on an asyncio loop.
+
+    Kernel.step() stays synchronous and runs on the loop thread, so a tick
+    sees a consistent snapshot and event order stays deterministic. Between
+    ticks, perception sources run concurrently as tasks and feed the event
+    queue through put(), which waits (backpressure) while the queue is full.
+    Without rate_hz a tick runs as soon as input or a finished executor job
+    arrives, and at least every idle_seconds; with rate_hz ticks are paced
+    like kernel.tick.run_tick_loop. The kernel's executor is attached to the
+    loop, so "async" goal handlers and tools are awaited here.
+    """
+
+    def __init__(
+        self,
+        kernel: Any,
+        rate_hz: Optional[float] = None,
+        idle_seconds: float = ASYNC_IDLE_TICK_SECONDS,
+    ):
+        self.kernel = kernel
+        self.rate_hz = rate_hz
+        self.idle_seconds = idle_seconds
+        self.stats = TickStats()
+        self._sources: List[Source] = []
+        self._wake: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+
+    def add_source(self, source: Source) -> "AsyncRuntime":
+        """Register a source coroutine, run as a task while the runtime runs."""
+        self._sources.append(source)
+        return self
+
+    def wake(self):
+        """Request a tick as soon as possible."""
+        if self._wake is not None:
+            self._wake.set()
+
+    def _wake_threadsafe(self, loop: asyncio.AbstractEventLoop):
+        # executor callbacks may fire from worker threads, even after run()
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self.wake)
+
+    async def wait_for_space(self):
+        """Wait until the kernel's event queue has room (after a tick)."""
+        while self.kernel.queue_free_slots() == 0:
+            self._space.clear()
+            await self._space.wait()
+
+    async def put(self, event: Any):
+        """Ingest an event, waiting for queue space instead of dropping it."""
+        await self.wait_for_space()
+        self.kernel.ingest_event(event)
+        self.wake()
+
+    async def run(self, max_ticks: Optional[int] = None) -> TickStats:
+        loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._space = asyncio.Event()
+        executor = self.kernel.executor
+        executor.attach_loop(loop)
+        executor.on_done = lambda: self._wake_threadsafe(loop)
+        tasks = [asyncio.create_task(src(self)) for src in self._sources]
+        try:
+            await self._tick_loop(max_ticks)
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            executor.on_done = None
+            executor.attach_loop(None)
+        return self.stats
+
+    async def _tick_loop(self, max_ticks: Optional[int]):
+        period = (1.0 / self.rate_hz) if self.rate_hz else None
+        next_start = time.monotonic()
+        ticks = 0
+        while True:
+            self._wake.clear()
+            start = time.monotonic()
+            jitter = max(0.0, start - next_start) if period else 0.0
+            self.kernel.step()
+            end = time.monotonic()
+            ticks += 1
+            overrun = period is not None and end - start > period
+            self.stats.record_tick(end - start, jitter=jitter, overrun=overrun)
+            self._space.set()
+
+            if max_ticks is not None and ticks >= max_ticks:
+                return
+
+            if period is not None:
+                next_start += period
+                if next_start < end:
+                    missed = int((end - next_start) // period) + 1
+                    self.stats.missed_slots += missed
+                    next_start += missed * period
+                await asyncio.sleep(max(0.0, next_start - time.monotonic()))
+            else:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.idle_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+
+# ---- perception sources ----
+
+
+def inbox_source(
+    watcher: InboxWatcher, max_files_per_tick: int = ASYNC_MAX_FILES_PER_TICK
+) -> Source:
+    """
+    Stream inbox files into the kernel. inotify watchers are driven by the
+    loop's reader callbacks; the polling fallback waits in a worker thread.
+    Events (whole small files or chunks of large ones) are read one at a
+    time in a worker thread and handed to put(), so a large file streams
+    at the pace the kernel drains its queue and never sits in memory whole.
+    """
+
+    async def run(rt: AsyncRuntime):
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        use_reader = isinstance(watcher, InotifyWatcher)
+        if use_reader:
+            loop.add_reader(watcher.fileno(), ready.set)
+        stream = InboxStream()
+        reading = False
+        try:
+            while True:
+                if not stream:
+                    if not watcher.has_pending():
+                        if use_reader:
+                            ready.clear()
+                            await ready.wait()
+                        else:
+                            await asyncio.to_thread(watcher.wait, rt.idle_seconds)
+                        continue
+                    stream.add(watcher.poll(max_files=max_files_per_tick))
+                reading = True
+                ev = await asyncio.to_thread(stream.next_event)
+                reading = False
+                if ev is not None:
+                    await rt.put(ev)
+        finally:
+            if use_reader:
+                loop.remove_reader(watcher.fileno())
+            # cancelled mid-read: the worker thread still owns the generator
+            if not reading:
+                stream.close()
+
+    return run
+
+
+async def _chat_lines(
+    rt: AsyncRuntime, reader: asyncio.StreamReader, user_id: str, channel: str
+):
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        text = line.decode("utf-8", errors="ignore").strip()
+        if text:
+            await rt.put(ingest_chat(text, user_id=user_id, channel=channel))
+
+
+def stdin_chat_source(user_id: str = "operator") -> Source:
+    """Each non-empty stdin line becomes a chat event."""
+
+    async def run(rt: AsyncRuntime):
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+        )
+        await _chat_lines(rt, reader, user_id, "stdin")
+
+    return run
+
+
+def socket_chat_source(path: Path, user_id: str = "operator") -> Source:
+    """Unix-socket chat: every connected client's lines become chat events."""
+
+    async def run(rt: AsyncRuntime):
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            try:
+                await _chat_lines(rt, reader, user_id, "socket")
+            finally:
+                writer.close()
+
+        Path(path).unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(handle, path=str(path))
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            Path(path).unlink(missing_ok=True)
+
+    return run
@@ -0,0 +1,241 @@
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from memory.atomic_io import atomic_write_text
+from memory.episodic import EpisodicMemory
+from memory.semantic.consolidate import consolidate
+from memory.semantic.memory import SemanticMemory
+from perception.events import Event
+from world.model import WorldModel
+from world.update_rules import apply_event
+
+CHECKPOINT_DIR = Path(__file__).parent.parent / "memory" / "checkpoints"
+CHECKPOINT_FORMAT_VERSION = 1
+# Write a checkpoint once this many episodes have been logged since the last
+CHECKPOINT_EVERY_EPISODES = 10_000
+# Checkpoints kept on disk (oldest pruned first)
+CHECKPOINT_KEEP = 3
+
+# Episode types that are raw perception input (everything else is derived)
+REPLAY_EVENT_TYPES: Tuple[str, ...] = ("chat", "file", "system", "goal")
+# Events applied between consolidation passes while replaying
+REPLAY_BATCH = 5_000
+
+_MANIFEST = "manifest.json"
+_WORLD_FILE = "world_state.json"
+_SEMANTIC_FILE = "semantic_state.json"
+_PREFIX = "ckpt-"
+
+
+class Checkpoint(NamedTuple):
+    path: Path
+    last_episode_id: int
+    created_ts: str
+
+
+class ReplayStats(NamedTuple):
+    events: int
+    last_episode_id: int
+    seconds: float
+    errors: List[Tuple[int, str]]  # (episode id, error) of events skipped
+
+
+def _fsync_dir(path: Path):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class CheckpointStore:
+    """
+    Versioned world + semantic snapshots, each tagged with the id of the
+    last episode whose events it contains.
+
+    A checkpoint is a directory ckpt-<episode id>/ holding the two state
+    files and a manifest. It is assembled in a temporary directory and
+    renamed into place, so a crash leaves either the whole checkpoint or
+    none of it; the manifest is written last and is what marks it valid.
+    """
+
+    def __init__(self, root: Path = CHECKPOINT_DIR, keep: int = CHECKPOINT_KEEP):
+        self.root = Path(root)
+        self.keep = keep
+
+    def list(self) -> List[Checkpoint]:
+        """Valid checkpoints, oldest first."""
+        if not self.root.exists():
+            return []
+        out: List[Checkpoint] = []
+        for d in self.root.iterdir():
+            if not d.is_dir() or not d.name.startswith(_PREFIX):
+                continue
+            try:
+                manifest = json.loads((d / _MANIFEST).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if manifest.get("version") != CHECKPOINT_FORMAT_VERSION:
+                continue
+            out.append(
+                Checkpoint(d, manifest["last_episode_id"], manifest["created_ts"])
+            )
+        out.sort(key=lambda c: c.last_episode_id)
+        return out
+
+    def latest(self) -> Optional[Checkpoint]:
+        ckpts = self.list()
+        return ckpts[-1] if ckpts else None
+
+    def write(
+        self, world: WorldModel, semantic: SemanticMemory, last_episode_id: int
+    ) -> Checkpoint:
+        self.root.mkdir(parents=True, exist_ok=True)
+        final = self.root / f"{_PREFIX}{last_episode_id:012d}"
+        tmp = self.root / f".{final.name}.tmp"
+        if tmp.exists():
+            shutil.rmtree(tmp)
+        tmp.mkdir()
+        atomic_write_text(tmp / _WORLD_FILE, json.dumps(world.snapshot()))
+        atomic_write_text(tmp / _SEMANTIC_FILE, json.dumps(semantic.snapshot()))
+        created_ts = datetime.utcnow().isoformat()
+        manifest = {
+            "version": CHECKPOINT_FORMAT_VERSION,
+            "last_episode_id": last_episode_id,
+            "created_ts": created_ts,
+            "entities": len(world.entities),
+            "relations": len(world.relations),
+            "facts": len(semantic.facts),
+        }
+        atomic_write_text(tmp / _MANIFEST, json.dumps(manifest, indent=2))
+        _fsync_dir(tmp)
+        if final.exists():
+            shutil.rmtree(final)
+        os.rename(tmp, final)
+        _fsync_dir(self.root)
+        self.prune()
+        return Checkpoint(final, last_episode_id, created_ts)
+
+    def load(
+        self,
+        ckpt: Checkpoint,
+        world_state_path: Optional[Path] = None,
+        world_journal_path: Optional[Path] = None,
+        semantic_state_path: Optional[Path] = None,
+        semantic_journal_path: Optional[Path] = None,
+    ) -> Tuple[WorldModel, SemanticMemory]:
+        """Rebuild the models from a checkpoint, bound to the given live paths."""
+        world_data = json.loads(
+            (ckpt.path / _WORLD_FILE).read_text(encoding="utf-8")
+        )
+        facts = json.loads((ckpt.path / _SEMANTIC_FILE).read_text(encoding="utf-8"))
+        world = WorldModel.from_snapshot(
+            world_data, world_state_path, world_journal_path
+        )
+        semantic = SemanticMemory.from_snapshot(
+            facts, semantic_state_path, semantic_journal_path
+        )
+        return world, semantic
+
+    def prune(self):
+        for ckpt in self.list()[: -self.keep or None]:
+            shutil.rmtree(ckpt.path, ignore_errors=True)
+
+
+def event_from_payload(payload: Dict[str, Any]) -> Event:
+    # trusted input (it was a valid event when logged); "goal" events are
+    # GoalEvents, which share the Event shape but not its event_type literal
+    return Event.model_construct(**payload)
+
+
+def replay_tape(
+    world: WorldModel,
+    semantic: SemanticMemory,
+    episodic: EpisodicMemory,
+    after_id: int = 0,
+    batch: int = REPLAY_BATCH,
+) -> ReplayStats:
+    """
+    Stream raw-event episodes with id > after_id through apply_event, and
+    consolidate the touched entities every `batch` events. The given models
+    are assumed to already reflect everything up to after_id. An event that
+    apply_event rejects is skipped and reported in errors: it failed the
+    same way when the kernel first processed it (and sent it to SAFE_MODE),
+    so it must not stop every later start. Payloads are applied as logged:
+    apply_event never reads the fields held in the blob store, so replay
+    does not read blobs.
+    """
+    start = time.perf_counter()
+    feed = world.open_change_feed()
+    feed.drain()  # models are consistent up to after_id; only track new work
+    events = 0
+    pending = 0
+    last = after_id
+    errors: List[Tuple[int, str]] = []
+    try:
+        for ep in episodic.iter_after_id(after_id, REPLAY_EVENT_TYPES):
+            try:
+                apply_event(world, event_from_payload(ep.payload))
+            except Exception as e:
+                errors.append((ep.id, str(e)))
+                last = ep.id
+                continue
+            last = ep.id
+            events += 1
+            pending += 1
+            if pending >= batch:
+                consolidate(world, semantic, feed.drain())
+                pending = 0
+        if feed:
+            consolidate(world, semantic, feed.drain())
+    finally:
+        world.close_change_feed(feed)
+    return ReplayStats(events, last, time.perf_counter() - start, errors)
+
+
+def rebuild_from_tape(
+    episodic: EpisodicMemory,
+    world_state_path: Optional[Path] = None,
+    world_journal_path: Optional[Path] = None,
+    semantic_state_path: Optional[Path] = None,
+    semantic_journal_path: Optional[Path] = None,
+    batch: int = REPLAY_BATCH,
+) -> Tuple[WorldModel, SemanticMemory, ReplayStats]:
+    """Full rebuild: fresh models replayed from the first episode."""
+    world = WorldModel(world_state_path, world_journal_path)
+    semantic = SemanticMemory(semantic_state_path, semantic_journal_path)
+    stats = replay_tape(world, semantic, episodic, after_id=0, batch=batch)
+    return world, semantic, stats
+
+
+def state_digest(world: WorldModel, semantic: SemanticMemory) -> Dict[str, Any]:
+    """
+    Id-independent summary for comparing two states (entity ids are random,
+    so a replayed model never matches the original id for id).
+    """
+    names = {e.id: (e.type, e.name) for e in world.entities.values()}
+
+    def ref(value: str) -> Any:
+        return names.get(value, value)
+
+    entities = sorted(
+        (e.type, e.name, json.dumps(e.meta, sort_keys=True))
+        for e in world.entities.values()
+    )
+    relations = sorted(
+        {(r.type, ref(r.src), ref(r.dst)) for r in world.relations.values()},
+        key=repr,
+    )
+    facts = sorted(
+        {(ref(f.subject), f.predicate, ref(f.object)) for f in semantic.facts.values()},
+        key=repr,
+    )
+    return {"entities": entities, "relations": relations, "facts": facts}
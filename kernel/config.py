@@ -0,0 +1,80 @@
+from pathlib import Path
+from typing import Optional
+from pydantic import BaseModel
+
+import eval.store as eval_store
+import kernel.checkpoint as checkpoint
+import memory.semantic.memory as semantic_memory
+import world.model as world_model
+
+_ROOT = Path(__file__).parent.parent
+
+IDENTITY_PATH = _ROOT / "identity" / "identity.yaml"
+EPISODIC_DB_PATH = _ROOT / "memory" / "episodic.db"
+SELF_STATE_PATH = _ROOT / "memory" / "self_state.json"
+GOALS_DB_PATH = _ROOT / "memory" / "goals.db"
+
+# SQLite target for in-memory kernels
+IN_MEMORY_DB = ":memory:"
+
+
+class KernelConfig(BaseModel):
+    """
+    Where a Kernel keeps its state. Every path is explicit so several kernels
+    can run side by side in one process; a None JSON path means that piece of
+    state is never written (in-memory), and the SQLite paths accept ":memory:".
+    """
+
+    identity_path: Path = IDENTITY_PATH
+    episodic_db: str = str(EPISODIC_DB_PATH)
+    goals_db: str = str(GOALS_DB_PATH)
+    self_state_path: Optional[Path] = SELF_STATE_PATH
+    world_state_path: Optional[Path] = world_model.WORLD_STATE_PATH
+    world_journal_path: Optional[Path] = world_model.WORLD_JOURNAL_PATH
+    semantic_state_path: Optional[Path] = semantic_memory.SEMANTIC_STATE_PATH
+    semantic_journal_path: Optional[Path] = semantic_memory.SEMANTIC_JOURNAL_PATH
+    eval_log_path: Optional[Path] = eval_store.EVAL_LOG_PATH
+    eval_rollup_path: Optional[Path] = eval_store.EVAL_ROLLUP_PATH
+    eval_legacy_path: Optional[Path] = eval_store.EVAL_STATE_PATH
+    checkpoint_dir: Optional[Path] = checkpoint.CHECKPOINT_DIR
+
+    @classmethod
+    def default(cls) -> "KernelConfig":
+        """The in-tree layout used by the scripts (memory/, world/, eval/)."""
+        return cls()
+
+    @classmethod
+    def at(cls, root: Path) -> "KernelConfig":
+        """All state under one storage root (created if missing)."""
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        return cls(
+            episodic_db=str(root / "episodic.db"),
+            goals_db=str(root / "goals.db"),
+            self_state_path=root / "self_state.json",
+            world_state_path=root / "world_state.json",
+            world_journal_path=root / "world_state.journal.jsonl",
+            semantic_state_path=root / "semantic_state.json",
+            semantic_journal_path=root / "semantic_state.journal.jsonl",
+            eval_log_path=root / "eval_records.jsonl",
+            eval_rollup_path=root / "eval_rollups.jsonl",
+            eval_legacy_path=None,
+            checkpoint_dir=root / "checkpoints",
+        )
+
+    @classmethod
+    def in_memory(cls) -> "KernelConfig":
+        """Nothing touches disk except reading the identity file."""
+        return cls(
+            episodic_db=IN_MEMORY_DB,
+            goals_db=IN_MEMORY_DB,
+            self_state_path=None,
+            world_state_path=None,
+            world_journal_path=None,
+            semantic_state_path=None,
+            semantic_journal_path=None,
+            eval_log_path=None,
+            eval_rollup_path=None,
+            eval_legacy_path=None,
+            checkpoint_dir=None,
+        )
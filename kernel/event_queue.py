@@ -0,0 +1,93 @@
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+# Lanes in drain order: operator chat first, goal output next, bulk ingest last.
+LANES: Tuple[str, ...] = ("operator", "goal", "bulk")
+
+
+def default_lane(event: Any) -> str:
+    event_type = getattr(event, "event_type", None)
+    if event_type == "chat":
+        return "operator"
+    if event_type == "goal":
+        return "goal"
+    return "bulk"
+
+
+class EventQueue:
+    """
+    Bounded, prioritized FIFO for kernel events.
+
+    Each lane is a deque (O(1) put/pop). drain() yields from higher-priority
+    lanes first and stops at a count or wall-time budget, leaving the
+    remainder for the next tick. put() refuses events once maxsize is
+    reached; producers should check free_slots()/full() and hold back
+    (backpressure).
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        lane_fn: Callable[[Any], str] = default_lane,
+    ):
+        self.maxsize = maxsize
+        self.lane_fn = lane_fn
+        self._lanes: Dict[str, Deque[Any]] = {name: deque() for name in LANES}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def full(self) -> bool:
+        return self.maxsize is not None and self._size >= self.maxsize
+
+    def free_slots(self) -> Optional[int]:
+        """Remaining capacity, or None when unbounded."""
+        if self.maxsize is None:
+            return None
+        return max(0, self.maxsize - self._size)
+
+    def put(self, event: Any, force: bool = False) -> bool:
+        """Enqueue an event. Returns False (and drops nothing) when full."""
+        if self.full() and not force:
+            return False
+        lane = self.lane_fn(event)
+        if lane not in self._lanes:
+            raise ValueError(f"Unknown event lane '{lane}'")
+        self._lanes[lane].append(event)
+        self._size += 1
+        return True
+
+    def pop(self) -> Any:
+        for lane in self._lanes.values():
+            if lane:
+                self._size -= 1
+                return lane.popleft()
+        raise IndexError("pop from empty EventQueue")
+
+    def drain(
+        self,
+        max_events: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+    ) -> Iterator[Any]:
+        """
+        Yield events in priority order until empty or a budget is spent.
+        The wall-time budget includes the caller's processing of each event;
+        at least one event is yielded per call so the queue always advances.
+        """
+        deadline = None if max_seconds is None else time.monotonic() + max_seconds
+        n = 0
+        while self._size:
+            if max_events is not None and n >= max_events:
+                return
+            if deadline is not None and n and time.monotonic() >= deadline:
+                return
+            n += 1
+            yield self.pop()
+
+    def lane_sizes(self) -> Dict[str, int]:
+        return {name: len(lane) for name, lane in self._lanes.items()}
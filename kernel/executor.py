@@ -0,0 +1,198 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Literal, NamedTuple, Optional
+
+# How a goal handler or tool runs: on the tick thread, in the thread pool
+# (I/O-bound work), in the process pool (CPU-bound; fn and args must pickle)
+# or as a coroutine on the asyncio loop (kernel.async_runtime)
+ExecMode = Literal["inline", "io", "cpu", "async"]
+EXEC_MODES = ("inline", "io", "cpu", "async")
+
+EXECUTOR_IO_WORKERS = 4
+EXECUTOR_CPU_WORKERS: Optional[int] = None  # None => os.cpu_count()
+# Jobs still unfinished after this long are reported as timed out
+EXECUTOR_DEFAULT_TIMEOUT_SECONDS: Optional[float] = 30.0
+
+
+class JobOutcome(NamedTuple):
+    """Final state of a submitted job, as reported by Executor.poll()."""
+
+    job_id: int
+    kind: str  # "goal" | "tool"
+    name: str
+    status: str  # ok | error | timeout | cancelled
+    result: Any
+    error: Optional[str]
+    seconds: float
+
+
+class _Job:
+    __slots__ = (
+        "job_id", "kind", "name", "future", "submitted", "deadline", "state"
+    )
+
+    def __init__(
+        self,
+        job_id: int,
+        kind: str,
+        name: str,
+        future: Future,
+        timeout: Optional[float],
+    ):
+        self.job_id = job_id
+        self.kind = kind
+        self.name = name
+        self.future = future
+        self.submitted = time.monotonic()
+        self.deadline = None if timeout is None else self.submitted + timeout
+        self.state: Optional[str] = None  # set on cancel/timeout
+
+
+class Executor:
+    """
+    Runs goal handlers and tools off the tick thread.
+
+    submit() hands work to a thread pool (io), a lazily started process
+    pool (cpu) or the attached asyncio loop (async) and returns a job id.
+    poll() is called once per tick and returns finished jobs strictly in
+    submission order, so whatever the kernel ingests from them is ordered
+    deterministically regardless of which worker finished first; an
+    unfinished job holds back later ones until it completes, times out or
+    is cancelled. A timed-out or cancelled job that is already running
+    cannot be interrupted; its result is discarded when it eventually
+    finishes.
+    """
+
+    def __init__(
+        self,
+        io_workers: int = EXECUTOR_IO_WORKERS,
+        cpu_workers: Optional[int] = EXECUTOR_CPU_WORKERS,
+    ):
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # called (from any thread) whenever a job finishes; the async runtime
+        # uses it to wake the tick loop
+        self.on_done: Optional[Callable[[], None]] = None
+        self._jobs: Deque[_Job] = deque()
+        self._by_id: Dict[int, _Job] = {}
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def attach_loop(self, loop: Optional[asyncio.AbstractEventLoop]):
+        """Event loop that runs "async" jobs (None detaches)."""
+        self._loop = loop
+
+    @property
+    def has_loop(self) -> bool:
+        """Whether "async" jobs can be submitted right now."""
+        return self._loop is not None
+
+    def _pool(self, mode: str):
+        if mode == "io":
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(
+                    max_workers=self.io_workers, thread_name_prefix="ordis-io"
+                )
+            return self._io_pool
+        if mode == "cpu":
+            if self._cpu_pool is None:
+                self._cpu_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+            return self._cpu_pool
+        raise ValueError(f"Invalid executor mode '{mode}'")
+
+    def submit(
+        self,
+        kind: str,
+        name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        mode: ExecMode = "io",
+        timeout: Optional[float] = EXECUTOR_DEFAULT_TIMEOUT_SECONDS,
+    ) -> int:
+        if mode == "async":
+            if self._loop is None:
+                raise ValueError("No event loop attached for async jobs")
+            future = asyncio.run_coroutine_threadsafe(fn(*args), self._loop)
+        else:
+            future = self._pool(mode).submit(fn, *args)
+        if self.on_done is not None:
+            on_done = self.on_done
+            future.add_done_callback(lambda _f: on_done())
+        job = _Job(self._next_id, kind, name, future, timeout)
+        self._next_id += 1
+        self._jobs.append(job)
+        self._by_id[job.job_id] = job
+        return job.job_id
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a pending job. False if unknown, reported or already stopped."""
+        job = self._by_id.get(job_id)
+        if job is None or job.state is not None:
+            return False
+        job.future.cancel()
+        job.state = "cancelled"
+        return True
+
+    def pending(self, job_id: int) -> bool:
+        return job_id in self._by_id
+
+    def poll(self) -> List[JobOutcome]:
+        """Outcomes of finished jobs, in submission order."""
+        now = time.monotonic()
+        for job in self._jobs:
+            if (
+                job.state is None
+                and job.deadline is not None
+                and now >= job.deadline
+                and not job.future.done()
+            ):
+                job.future.cancel()
+                job.state = "timeout"
+
+        out: List[JobOutcome] = []
+        while self._jobs:
+            job = self._jobs[0]
+            if job.state is None and not job.future.done():
+                break
+            self._jobs.popleft()
+            del self._by_id[job.job_id]
+            out.append(self._outcome(job, now))
+        return out
+
+    @staticmethod
+    def _outcome(job: _Job, now: float) -> JobOutcome:
+        seconds = now - job.submitted
+        state = job.state
+        if state is None and job.future.cancelled():
+            state = "cancelled"
+        if state is not None:
+            return JobOutcome(
+                job.job_id, job.kind, job.name, state, None, None, seconds
+            )
+        exc = job.future.exception()
+        if exc is not None:
+            return JobOutcome(
+                job.job_id, job.kind, job.name, "error", None, repr(exc), seconds
+            )
+        return JobOutcome(
+            job.job_id, job.kind, job.name, "ok", job.future.result(), None, seconds
+        )
+
+    def shutdown(self) -> int:
+        """Cancel queued work and stop the pools. Returns jobs left unreported."""
+        abandoned = len(self._jobs)
+        for pool in (self._io_pool, self._cpu_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool = None
+        self._cpu_pool = None
+        self._jobs.clear()
+        self._by_id.clear()
+        return abandoned
@@ -0,0 +1,203 @@
+import inspect
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+# Wall-time slice per goal per tick. Generator handlers are suspended at the
+# first yield past it; plain handlers cannot be preempted and are only
+# flagged as overruns.
+GOAL_SLICE_SECONDS = 0.05
+# Total goal time per tick; at least one goal always runs
+GOAL_TICK_BUDGET_SECONDS = 0.2
+# Upper bound on goals run per tick (None => as many as the budget allows)
+GOAL_MAX_PER_TICK: Optional[int] = 8
+
+# Stride scheduling: a goal's pass advances by STRIDE_ONE / weight per slice
+STRIDE_ONE = 1 << 16
+
+
+def _weight(priority: int) -> int:
+    return max(int(priority), 1)
+
+
+def handler_events(out: Any) -> List[Any]:
+    """Normalize a handler result or yielded value into a list of events."""
+    if out is None:
+        return []
+    if isinstance(out, list):
+        return out
+    return [out]
+
+
+class GoalSlice(NamedTuple):
+    """Outcome of one goal's slice within a tick."""
+
+    events: List[Any]
+    seconds: float
+    finished: bool  # False => a generator handler was suspended mid-run
+    overrun: bool
+
+
+class GoalStats:
+    """Per-goal runtime statistics."""
+
+    def __init__(self):
+        self.slices = 0
+        self.runs_finished = 0
+        self.events = 0
+        self.overruns = 0
+        self.errors = 0
+        self.seconds_total = 0.0
+        self.seconds_max = 0.0
+
+    def record(self, s: GoalSlice):
+        self.slices += 1
+        self.events += len(s.events)
+        self.seconds_total += s.seconds
+        self.seconds_max = max(self.seconds_max, s.seconds)
+        if s.finished:
+            self.runs_finished += 1
+        if s.overrun:
+            self.overruns += 1
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "slices": self.slices,
+            "runs_finished": self.runs_finished,
+            "events": self.events,
+            "overruns": self.overruns,
+            "errors": self.errors,
+            "seconds_mean": self.seconds_total / max(self.slices, 1),
+            "seconds_max": self.seconds_max,
+        }
+
+
+class GoalScheduler:
+    """
+    Cooperative, priority-weighted time slicing for goal handlers.
+
+    Each tick, order() ranks the runnable goals by stride-scheduling pass
+    (lowest first), so over many ticks a goal gets slices in proportion to
+    its priority whenever the tick budget cannot fit everyone. run() gives a
+    goal one slice: a plain handler is called once; a generator handler is
+    resumed until it finishes or its slice is used up, and then continues
+    from the same yield on the goal's next slice. Yielded values and return
+    values are events (or lists of events), like plain handler results.
+    """
+
+    def __init__(
+        self,
+        slice_seconds: float = GOAL_SLICE_SECONDS,
+        budget_seconds: Optional[float] = GOAL_TICK_BUDGET_SECONDS,
+        max_per_tick: Optional[int] = GOAL_MAX_PER_TICK,
+    ):
+        self.slice_seconds = slice_seconds
+        self.budget_seconds = budget_seconds
+        self.max_per_tick = max_per_tick
+        self.stats: Dict[str, GoalStats] = {}
+        self._pass: Dict[str, float] = {}
+        self._running: Dict[str, Generator[Any, None, Any]] = {}
+
+    def is_suspended(self, goal_id: str) -> bool:
+        return goal_id in self._running
+
+    def forget(self, goal_id: str):
+        """Drop a suspended generator (e.g. the handler was replaced)."""
+        gen = self._running.pop(goal_id, None)
+        if gen is not None:
+            gen.close()
+
+    def order(self, priorities: Dict[str, int]) -> List[str]:
+        """Runnable goal ids in stride order; newcomers join at the lowest pass."""
+        if not priorities:
+            return []
+        known = [self._pass[g] for g in priorities if g in self._pass]
+        floor = min(known) if known else 0.0
+        for gid in priorities:
+            self._pass.setdefault(gid, floor)
+        return sorted(
+            priorities, key=lambda g: (self._pass[g], -priorities[g], g)
+        )
+
+    def budget_left(self, started: float, ran: int) -> bool:
+        if ran == 0:
+            return True
+        if self.max_per_tick is not None and ran >= self.max_per_tick:
+            return False
+        if self.budget_seconds is None:
+            return True
+        return time.perf_counter() - started < self.budget_seconds
+
+    def run(
+        self,
+        goal_id: str,
+        handler: Callable[[Any], Any],
+        arg: Any,
+        priority: int = 0,
+    ) -> GoalSlice:
+        """Run one slice of a goal. Exceptions propagate after bookkeeping."""
+        start = time.perf_counter()
+        deadline = start + self.slice_seconds
+        events: List[Any] = []
+        finished = True
+        try:
+            gen = self._running.pop(goal_id, None)
+            if gen is None:
+                out = handler(arg)
+                if inspect.isgenerator(out):
+                    gen = out
+                else:
+                    events.extend(handler_events(out))
+            if gen is not None:
+                finished = self._resume(gen, events, deadline)
+                if not finished:
+                    self._running[goal_id] = gen
+        except Exception:
+            self.stats.setdefault(goal_id, GoalStats()).errors += 1
+            raise
+
+        seconds = time.perf_counter() - start
+        s = GoalSlice(
+            events=events,
+            seconds=seconds,
+            finished=finished,
+            overrun=seconds > self.slice_seconds,
+        )
+        self.stats.setdefault(goal_id, GoalStats()).record(s)
+        # charge by slices actually used, so long-running goals pay for it
+        self.charge(goal_id, priority, max(1.0, seconds / self.slice_seconds))
+        return s
+
+    def charge(self, goal_id: str, priority: int = 0, quanta: float = 1.0):
+        """Advance a goal's pass, e.g. for work it handed off to the executor."""
+        self._pass[goal_id] = (
+            self._pass.get(goal_id, 0.0) + quanta * STRIDE_ONE / _weight(priority)
+        )
+
+    @staticmethod
+    def _resume(
+        gen: Generator[Any, None, Any], events: List[Any], deadline: float
+    ) -> bool:
+        """Advance a generator until it returns (True) or the slice ends (False)."""
+        while True:
+            try:
+                events.extend(handler_events(next(gen)))
+            except StopIteration as stop:
+                events.extend(handler_events(stop.value))
+                return True
+            if time.perf_counter() >= deadline:
+                return False
+
+    def summary(
+        self, goal_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, object]]:
+        ids = self.stats.keys() if goal_ids is None else goal_ids
+        return {g: self.stats[g].summary() for g in ids if g in self.stats}
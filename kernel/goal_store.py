@@ -0,0 +1,167 @@
+import heapq
+import sqlite3
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+# (id, description, priority, status, created_ts, updated_ts, meta_json)
+GoalRow = Tuple[str, str, int, str, str, str, Optional[str]]
+
+# Rebuild a status heap once stale entries outnumber live ones by this factor
+GOAL_HEAP_COMPACT_RATIO = 2
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS goals (
+    id TEXT PRIMARY KEY,
+    description TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'active',
+    created_ts TEXT NOT NULL,
+    updated_ts TEXT NOT NULL,
+    meta_json TEXT
+)
+"""
+_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_goals_status_priority ON goals (status, priority)"
+)
+_SELECT_ALL_SQL = (
+    "SELECT id, description, priority, status, created_ts, updated_ts, meta_json "
+    "FROM goals"
+)
+# New goals start 'active'; an existing goal keeps its status and created_ts.
+_UPSERT_SQL = """
+INSERT INTO goals (id, description, priority, status, created_ts, updated_ts, meta_json)
+VALUES (?, ?, ?, 'active', ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    description = excluded.description,
+    priority = excluded.priority,
+    updated_ts = excluded.updated_ts,
+    meta_json = excluded.meta_json
+"""
+_SET_STATUS_SQL = "UPDATE goals SET status=?, updated_ts=? WHERE id=?"
+
+# Heap entry: (sort key, goal id, version); stale once the goal's version moves on
+_HeapEntry = Tuple[int, str, int]
+
+
+class GoalStore:
+    """
+    goals.db plus an in-memory registry of every goal row.
+
+    Reads never touch SQLite: rows are cached by id, and each status keeps a
+    min-heap and a max-heap on priority (ties by id) so homeostasis can pick
+    its pause/resume candidate in O(log n). Heaps use lazy deletion: every
+    write bumps the goal's version and pushes fresh entries, and older
+    entries are dropped when they surface. All writes go through this class,
+    so the registry and the table cannot drift apart.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.conn.execute(_SCHEMA_SQL)
+        self.conn.execute(_INDEX_SQL)
+        self.conn.commit()
+
+        self._rows: Dict[str, GoalRow] = {}
+        self._version: Dict[str, int] = {}
+        self._min_heaps: Dict[str, List[_HeapEntry]] = defaultdict(list)
+        self._max_heaps: Dict[str, List[_HeapEntry]] = defaultdict(list)
+        self._status_counts: Dict[str, int] = defaultdict(int)
+        for row in self.conn.execute(_SELECT_ALL_SQL):
+            self._index(tuple(row))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, goal_id: str) -> bool:
+        return goal_id in self._rows
+
+    # ---- registry maintenance ----
+
+    def _index(self, row: GoalRow):
+        goal_id, priority, status = row[0], row[2], row[3]
+        old = self._rows.get(goal_id)
+        if old is not None:
+            self._status_counts[old[3]] -= 1
+        version = self._version.get(goal_id, 0) + 1
+        self._version[goal_id] = version
+        self._rows[goal_id] = row
+        self._status_counts[status] += 1
+        heapq.heappush(self._min_heaps[status], (priority, goal_id, version))
+        heapq.heappush(self._max_heaps[status], (-priority, goal_id, version))
+        self._maybe_compact(status)
+        if old is not None and old[3] != status:
+            self._maybe_compact(old[3])
+
+    def _live(self, entry: _HeapEntry) -> bool:
+        return self._version.get(entry[1]) == entry[2]
+
+    def _peek(self, heap: List[_HeapEntry]) -> Optional[GoalRow]:
+        while heap and not self._live(heap[0]):
+            heapq.heappop(heap)
+        return self._rows[heap[0][1]] if heap else None
+
+    def _maybe_compact(self, status: str):
+        live = self._status_counts[status]
+        for heaps in (self._min_heaps, self._max_heaps):
+            heap = heaps[status]
+            if len(heap) > GOAL_HEAP_COMPACT_RATIO * live + 16:
+                heap[:] = [e for e in heap if self._live(e)]
+                heapq.heapify(heap)
+
+    # ---- writes ----
+
+    def upsert(
+        self,
+        goal_id: str,
+        description: str,
+        priority: int,
+        meta_json: Optional[str],
+        now: str,
+    ) -> GoalRow:
+        """Create or update a goal; status and created_ts survive updates."""
+        with self.conn:
+            self.conn.execute(
+                _UPSERT_SQL, (goal_id, description, priority, now, now, meta_json)
+            )
+        old = self._rows.get(goal_id)
+        status = old[3] if old is not None else "active"
+        created_ts = old[4] if old is not None else now
+        row = (goal_id, description, priority, status, created_ts, now, meta_json)
+        self._index(row)
+        return row
+
+    def set_status(self, goal_id: str, status: str, now: str) -> bool:
+        """Change a goal's status. Returns False for unknown goal ids."""
+        with self.conn:
+            self.conn.execute(_SET_STATUS_SQL, (status, now, goal_id))
+        old = self._rows.get(goal_id)
+        if old is None:
+            return False
+        self._index(old[:3] + (status, old[4], now, old[6]))
+        return True
+
+    # ---- reads ----
+
+    def get(self, goal_id: str) -> Optional[GoalRow]:
+        return self._rows.get(goal_id)
+
+    def lowest(self, status: str) -> Optional[GoalRow]:
+        """Lowest-priority goal with this status, or None."""
+        return self._peek(self._min_heaps[status])
+
+    def highest(self, status: str) -> Optional[GoalRow]:
+        """Highest-priority goal with this status, or None."""
+        return self._peek(self._max_heaps[status])
+
+    def count(self, status: str) -> int:
+        return self._status_counts[status]
+
+    def list(
+        self, status: Optional[str] = None, descending: bool = True
+    ) -> List[GoalRow]:
+        """Goal rows, optionally filtered by status, ordered by priority."""
+        rows = [
+            r for r in self._rows.values() if status is None or r[3] == status
+        ]
+        rows.sort(key=lambda r: (-r[2], r[0]) if descending else (r[2], r[0]))
+        return rows
@@ -1,21 +1,46 @@
 from pydantic import BaseModel, Field
+import inspect
 import sqlite3
+import time
 import yaml
-from pathlib import Path
 from datetime import datetime
 import json
-from typing import Any, Dict, List, Optional, Callable
-from world.model import WorldModel
+from typing import Any, Dict, List, Optional, Callable, Tuple
+from world.model import ChangeFeed, WorldModel
 from world.update_rules import apply_event
 from eval.store import EvalStore
-from eval.coherence import run_coherence_eval
+from eval.coherence import CoherenceEvaluator
 from memory.semantic.memory import SemanticMemory
 from memory.semantic.consolidate import consolidate
-
-IDENTITY_PATH = Path(__file__).parent.parent / "identity" / "identity.yaml"
-EPISODIC_DB_PATH = Path(__file__).parent.parent / "memory" / "episodic.db"
-SELF_STATE_PATH = Path(__file__).parent.parent / "memory" / "self_state.json"
-GOALS_DB_PATH = Path(__file__).parent.parent / "memory" / "goals.db"
+from memory.episodic_writer import EpisodicWriter, configure_wal
+from memory.episodic import EpisodicMemory, init_episodic_schema
+from memory.blob_store import BlobStore
+from kernel.event_queue import EventQueue
+from kernel.scheduler import PhaseCadence, PhaseScheduler
+from kernel.metrics import TickProfiler
+from kernel.goal_store import GoalStore
+from kernel.goal_scheduler import GoalScheduler, handler_events
+from kernel.executor import EXEC_MODES, ExecMode, Executor, JobOutcome
+from perception.events import Event
+from tools import ToolRouter
+from memory.sqlite_store import init_sqlite
+from memory.atomic_io import atomic_write_text
+from kernel.checkpoint import (
+    CHECKPOINT_EVERY_EPISODES,
+    Checkpoint,
+    CheckpointStore,
+    ReplayStats,
+    rebuild_from_tape,
+    replay_tape,
+)
+
+from kernel.config import (  # noqa: F401  (paths re-exported for scripts)
+    EPISODIC_DB_PATH,
+    GOALS_DB_PATH,
+    IDENTITY_PATH,
+    SELF_STATE_PATH,
+    KernelConfig,
+)
 
 # Homeostasis v0: if coherence drops below this, enter SAFE_MODE
 HOMEOSTASIS_MIN_COHERENCE = 0.6
@@ -24,7 +49,28 @@ HOMEOSTASIS_WARN_COHERENCE = 0.75
 # If coherence rises back above this, resume highest‑priority paused goal
 HOMEOSTASIS_RESUME_COHERENCE = 0.85
 
-# Deterministic goal handler signature (v1: handlers may emit events)
+# Event queue: producers get backpressure past this many pending events
+EVENT_QUEUE_MAXSIZE = 10_000
+# Per-tick processing budget; the remainder carries over to the next tick
+TICK_EVENT_BUDGET = 1_000
+TICK_EVENT_BUDGET_SECONDS = 0.5
+
+# Scheduler: per-phase cadence overrides (see kernel.scheduler) and the tick
+# budget after which skippable phases are deferred (None => never defer)
+PHASE_CADENCES: Dict[str, PhaseCadence] = {}
+TICK_BUDGET_SECONDS: Optional[float] = None
+# Heartbeat rate for main(); None => ticks run back-to-back
+TICK_RATE_HZ: Optional[float] = None
+
+# Record per-phase timings/counters into health_metrics each tick
+TICK_PROFILING = True
+
+# Eval: also run the full coherence pass each tick and fail on divergence
+COHERENCE_DIFFERENTIAL_CHECK = False
+
+# Deterministic goal handler signature (v1: handlers may emit events; a
+# generator handler yields events and is resumed across ticks, see
+# kernel.goal_scheduler)
 GoalHandler = Callable[["Kernel"], Optional[Any]]
 
 
@@ -58,43 +104,284 @@ class GoalEvent(BaseModel):
 
 
 class Kernel:
-    def __init__(self):
+    def __init__(
+        self,
+        config: Optional[KernelConfig] = None,
+        cadences: Optional[Dict[str, PhaseCadence]] = None,
+        tick_budget_seconds: Optional[float] = TICK_BUDGET_SECONDS,
+    ):
+        self.config = config if config is not None else KernelConfig.default()
         self.identity = self._load_identity()
         self.conn = self._init_episodic_db()
+        self.episodes = EpisodicWriter(self.conn)
+        self.episodic = EpisodicMemory(self.conn)
+        self.blobs = BlobStore(self.conn)
         self.goals_conn = self._init_goals_db()
-        self.world = WorldModel.load()
-        self.semantic = SemanticMemory.load()
-        self.eval_store = EvalStore.load()
-        self._event_queue: List[Any] = []
+        self.goals = GoalStore(self.goals_conn)
+        cfg = self.config
+        self.checkpoints: Optional[CheckpointStore] = (
+            CheckpointStore(cfg.checkpoint_dir)
+            if cfg.checkpoint_dir is not None
+            else None
+        )
+        self._checkpoint_episode_id = 0
+        # World/semantic/eval state is hydrated on first use (see the
+        # properties below), so scripts that never read it skip the load.
+        self._world: Optional[WorldModel] = None
+        self._semantic: Optional[SemanticMemory] = None
+        self._eval_store: Optional[EvalStore] = None
+        self._coherence: Optional[CoherenceEvaluator] = None
+        # entities/relations touched since the last consolidation and since
+        # the last checkpoint (opened with the world; None => nothing loaded,
+        # so nothing touched)
+        self._consolidation_feed: Optional[ChangeFeed] = None
+        self._checkpoint_feed: Optional[ChangeFeed] = None
+        self._event_queue = EventQueue(maxsize=EVENT_QUEUE_MAXSIZE)
         self.safe_mode: bool = False
         self.self_state = self._load_self_state()
+        self._self_state_dirty = False
+        self._self_state_bytes = 0  # cumulative, for tick I/O metrics
         # keep safe_mode flags in sync
         self.safe_mode = self.self_state.safe_mode
         # Goal execution v0: deterministic handlers (no intelligence)
         self.goal_handlers: Dict[str, GoalHandler] = {}
+        self.goal_scheduler = GoalScheduler()
+        # io/cpu-bound handlers and tools run off the tick thread
+        self.executor = Executor()
+        self.tools = ToolRouter(self.executor)
+        self.goal_modes: Dict[str, ExecMode] = {}
+        self._goal_jobs: Dict[str, int] = {}  # goal id -> in-flight job id
+        # async goals skipped for lack of an event loop (logged once each)
+        self._goals_without_loop: Dict[str, None] = {}
+        self.scheduler = PhaseScheduler(
+            cadences if cadences is not None else PHASE_CADENCES,
+            budget_seconds=tick_budget_seconds,
+        )
+        self.profiler = TickProfiler(enabled=TICK_PROFILING)
+
+    # ---- lazily hydrated state ----
+    @property
+    def world(self) -> WorldModel:
+        if self._world is None:
+            self._hydrate_state()
+        return self._world
+
+    @property
+    def semantic(self) -> SemanticMemory:
+        if self._semantic is None:
+            self._hydrate_state()
+        return self._semantic
+
+    @property
+    def eval_store(self) -> EvalStore:
+        if self._eval_store is None:
+            cfg = self.config
+            self._eval_store = EvalStore.load(
+                cfg.eval_log_path, cfg.eval_rollup_path, cfg.eval_legacy_path
+            )
+        return self._eval_store
+
+    @property
+    def coherence(self) -> CoherenceEvaluator:
+        if self._coherence is None:
+            self._coherence = CoherenceEvaluator(
+                self.world, self.semantic, verify=COHERENCE_DIFFERENTIAL_CHECK
+            )
+        return self._coherence
+
+    def hydrate(self):
+        """Load all persisted state now instead of on first use."""
+        for name in ("world", "eval_store", "coherence"):
+            getattr(self, name)
+
+    def _hydrate_state(self):
+        # world and semantic load together: a checkpoint restore replays
+        # the tape tail into both
+        start = time.perf_counter()
+        world, semantic, replayed = self._restore_state()
+        self._attach_state(world, semantic)
+        if replayed is not None:
+            # the replay consolidated everything it applied
+            self._consolidation_feed.drain()
+            if replayed.events == 0:
+                self._checkpoint_feed.drain()  # state is exactly the checkpoint
+        self.log_episode(
+            "state_hydrate",
+            {
+                "entities": len(world.entities),
+                "facts": len(semantic.facts),
+                "seconds": round(time.perf_counter() - start, 6),
+            },
+        )
+
+    def _attach_state(self, world: WorldModel, semantic: SemanticMemory):
+        # new feeds start 'full': everything counts as unconsolidated and
+        # not yet checkpointed until the caller says otherwise
+        self._world, self._semantic = world, semantic
+        self._consolidation_feed = world.open_change_feed()
+        self._checkpoint_feed = world.open_change_feed()
+
+    def _restore_state(
+        self,
+    ) -> Tuple[WorldModel, SemanticMemory, Optional[ReplayStats]]:
+        """
+        World + semantic state at startup: the newest checkpoint plus a replay
+        of the episodes logged after it, or the live state files when there
+        is no checkpoint yet (replay stats None).
+        """
+        cfg = self.config
+        ckpt = self.checkpoints.latest() if self.checkpoints is not None else None
+        if ckpt is None:
+            return (
+                WorldModel.load(cfg.world_state_path, cfg.world_journal_path),
+                SemanticMemory.load(
+                    cfg.semantic_state_path, cfg.semantic_journal_path
+                ),
+                None,
+            )
+
+        world, semantic = self.checkpoints.load(
+            ckpt,
+            cfg.world_state_path,
+            cfg.world_journal_path,
+            cfg.semantic_state_path,
+            cfg.semantic_journal_path,
+        )
+        stats = replay_tape(
+            world, semantic, self.episodic, after_id=ckpt.last_episode_id
+        )
+        self._checkpoint_episode_id = ckpt.last_episode_id
+        for episode_id, error in stats.errors:
+            self.log_episode(
+                "kernel_error",
+                {"phase": "replay", "episode_id": episode_id, "error": error},
+            )
+        if stats.events:
+            # live state files now mirror checkpoint + tail. With no tail
+            # they are left alone: models built from a checkpoint write a
+            # fresh snapshot on their first save() anyway.
+            world.compact()
+            semantic.compact()
+        self.log_episode(
+            "checkpoint_restore",
+            {
+                "checkpoint": ckpt.path.name,
+                "replayed_events": stats.events,
+                "skipped_events": len(stats.errors),
+                "last_episode_id": stats.last_episode_id,
+                "seconds": round(stats.seconds, 6),
+            },
+        )
+        return world, semantic, stats
+
+    def maybe_checkpoint(self, force: bool = False) -> Optional[Checkpoint]:
+        """
+        Write a checkpoint once CHECKPOINT_EVERY_EPISODES episodes have been
+        logged since the last one (right away when force), if the world
+        changed since then. Only taken when every logged event has been
+        applied and consolidated, so the snapshot is exactly the tape up to
+        its episode id. Changes that are not on the tape (compaction, manual
+        edits) survive a restart only through a checkpoint: force one after
+        making them.
+        """
+        if (
+            self.checkpoints is None
+            or self._world is None  # never loaded => nothing new to snapshot
+            or self._event_queue
+            or self._consolidation_feed
+            or not self._checkpoint_feed
+        ):
+            return None
+        self.episodes.flush()
+        last = self.episodic.max_id()
+        if not force and last - self._checkpoint_episode_id < CHECKPOINT_EVERY_EPISODES:
+            return None
+        ckpt = self.checkpoints.write(self.world, self.semantic, last)
+        self._checkpoint_episode_id = last
+        self._checkpoint_feed.drain()
+        self.log_episode(
+            "checkpoint", {"checkpoint": ckpt.path.name, "last_episode_id": last}
+        )
+        return ckpt
+
+    def rebuild_from_tape(self) -> ReplayStats:
+        """
+        Replace world + semantic state with a full replay of the tape, persist
+        it to the live state files and checkpoint it.
+        """
+        cfg = self.config
+        self.episodes.flush()
+        world, semantic, stats = rebuild_from_tape(
+            self.episodic,
+            cfg.world_state_path,
+            cfg.world_journal_path,
+            cfg.semantic_state_path,
+            cfg.semantic_journal_path,
+        )
+        self._attach_state(world, semantic)
+        self._consolidation_feed.drain()
+        self._coherence = None
+        world.compact()
+        semantic.compact()
+        for episode_id, error in stats.errors:
+            self.log_episode(
+                "kernel_error",
+                {"phase": "replay", "episode_id": episode_id, "error": error},
+            )
+        self.log_episode(
+            "tape_rebuild",
+            {
+                "replayed_events": stats.events,
+                "skipped_events": len(stats.errors),
+                "last_episode_id": stats.last_episode_id,
+                "seconds": round(stats.seconds, 6),
+            },
+        )
+        if self.checkpoints is not None and not self._event_queue:
+            self.checkpoints.write(world, semantic, stats.last_episode_id)
+            self._checkpoint_episode_id = stats.last_episode_id
+            self._checkpoint_feed.drain()
+        return stats
 
     def _load_identity(self) -> Identity:
-        with open(IDENTITY_PATH, "r") as f:
+        with open(self.config.identity_path, "r") as f:
             data = yaml.safe_load(f)
         return Identity(**data)
 
     def _load_self_state(self) -> SelfState:
-        if not SELF_STATE_PATH.exists():
+        path = self.config.self_state_path
+        if path is None:
+            return SelfState()
+        if not path.exists():
             ss = SelfState()
-            SELF_STATE_PATH.write_text(ss.model_dump_json(indent=2), encoding="utf-8")
+            atomic_write_text(path, ss.model_dump_json(indent=2))
             return ss
-        data = json.loads(SELF_STATE_PATH.read_text(encoding="utf-8"))
+        data = json.loads(path.read_text(encoding="utf-8"))
         return SelfState(**data)
 
     def _save_self_state(self):
+        """Mark self-state dirty; it is written once per tick by the flush."""
         # mirror kernel flag
         self.self_state.safe_mode = self.safe_mode
-        SELF_STATE_PATH.write_text(
-            self.self_state.model_dump_json(indent=2), encoding="utf-8"
-        )
+        self._self_state_dirty = True
+
+    def _flush_self_state(self):
+        """Atomically persist self-state if anything changed since the last flush."""
+        if not self._self_state_dirty:
+            return
+        self.self_state.safe_mode = self.safe_mode
+        if self.config.self_state_path is not None:
+            self._self_state_bytes += atomic_write_text(
+                self.config.self_state_path,
+                self.self_state.model_dump_json(indent=2),
+            )
+        self._self_state_dirty = False
 
     def _init_episodic_db(self):
-        conn = sqlite3.connect(EPISODIC_DB_PATH)
+        conn = sqlite3.connect(self.config.episodic_db)
+        configure_wal(conn)
+        # health_metrics (tick profiler) lives next to the episodes
+        init_sqlite(conn)
         cur = conn.cursor()
 
         # Ensure base table exists (old or new schema)
@@ -104,83 +391,119 @@ class Kernel:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 ts TEXT NOT NULL,
                 event_type TEXT NOT NULL,
-                payload TEXT NOT NULL
+                payload_json TEXT NOT NULL
             )
             """
         )
         conn.commit()
 
-        # --- schema migration: add payload_json if missing ---
         cur.execute("PRAGMA table_info(episodes)")
         cols = [row[1] for row in cur.fetchall()]
+
+        # --- schema migration: add payload_json if missing ---
         if "payload_json" not in cols:
             cur.execute("ALTER TABLE episodes ADD COLUMN payload_json TEXT")
             conn.commit()
 
-            # Backfill payload_json from legacy payload column if it exists
-            if "payload" in cols:
-                cur.execute(
-                    "UPDATE episodes SET payload_json = payload WHERE payload_json IS NULL"
-                )
-                conn.commit()
+        # --- schema migration: drop the legacy duplicate payload column ---
+        if "payload" in cols:
+            self._drop_legacy_payload_column(conn)
 
+        # read side: ts_unix + indexes + FTS5 (see memory.episodic)
+        init_episodic_schema(conn)
         return conn
 
-    def _init_goals_db(self):
-        conn = sqlite3.connect(GOALS_DB_PATH)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS goals (
-                id TEXT PRIMARY KEY,
-                description TEXT NOT NULL,
-                priority INTEGER NOT NULL DEFAULT 0,
-                status TEXT NOT NULL DEFAULT 'active',
-                created_ts TEXT NOT NULL,
-                updated_ts TEXT NOT NULL,
-                meta_json TEXT
+    def _drop_legacy_payload_column(self, conn):
+        """Fold legacy `payload` into payload_json, then drop it and reclaim space."""
+        with conn:
+            conn.execute(
+                "UPDATE episodes SET payload_json = payload WHERE payload_json IS NULL"
             )
-            """
-        )
-        conn.commit()
-        return conn
-
-    def log_episode(self, event_type: str, payload: Dict[str, Any]):
-        ts = datetime.utcnow().isoformat()
-        payload_json = json.dumps(payload, ensure_ascii=False)
-        # Legacy column kept for backward compatibility / NOT NULL constraint
-        legacy_payload = payload_json
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO episodes (ts, event_type, payload, payload_json) VALUES (?, ?, ?, ?)",
-            (ts, event_type, legacy_payload, payload_json),
-        )
-        self.conn.commit()
+            if sqlite3.sqlite_version_info >= (3, 35, 0):
+                conn.execute("ALTER TABLE episodes DROP COLUMN payload")
+            else:
+                # older SQLite: rebuild the table without the column
+                conn.execute(
+                    """
+                    CREATE TABLE episodes_new (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        ts TEXT NOT NULL,
+                        event_type TEXT NOT NULL,
+                        payload_json TEXT NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    "INSERT INTO episodes_new (id, ts, event_type, payload_json) "
+                    "SELECT id, ts, event_type, payload_json FROM episodes"
+                )
+                conn.execute("DROP TABLE episodes")
+                conn.execute("ALTER TABLE episodes_new RENAME TO episodes")
+        conn.execute("VACUUM")
 
-    def enqueue_event(self, event: Any):
-        """Stage a perception event to be processed on the next tick."""
-        self._event_queue.append(event)
+    def _init_goals_db(self):
+        # schema, (status, priority) index and the in-memory registry live
+        # in GoalStore
+        return sqlite3.connect(self.config.goals_db)
 
-    def ingest_event(self, event: Any):
-        """Record an event and queue it for deterministic processing on tick."""
+    def log_episode(
+        self, event_type: str, payload: Dict[str, Any], blob_text: Optional[str] = None
+    ):
+        """Buffer an episode; it is committed with the rest of the tick."""
+        self.episodes.append(event_type, payload, blob_text)
+
+    def _enter_safe_mode(self, event_type: str, payload: Dict[str, Any]):
+        """Log the reason and enter SAFE_MODE with the tape flushed to disk."""
+        self.safe_mode = True
+        self.log_episode(event_type, payload)
+        self.episodes.flush()
+        self._save_self_state()
+        self._flush_self_state()
+
+    def enqueue_event(self, event: Any, force: bool = False) -> bool:
+        """Stage a perception event to be processed on a later tick."""
+        return self._event_queue.put(event, force=force)
+
+    def queue_free_slots(self) -> Optional[int]:
+        """Backpressure signal for producers: room left in the event queue."""
+        return self._event_queue.free_slots()
+
+    def ingest_event(self, event: Any, force: bool = False) -> bool:
+        """
+        Record an event and queue it for deterministic processing on tick.
+        Returns False when the queue is full; the event is then neither
+        queued nor logged as ingested (only the rejection is logged).
+        """
+        if self._event_queue.full() and not force:
+            self.log_episode(
+                "event_rejected",
+                {"reason": "queue_full", "event_type": event.event_type},
+            )
+            return False
         payload = event.model_dump() if hasattr(event, "model_dump") else event.__dict__
-        # Log raw event
-        self.log_episode(event.event_type, payload)
+        # Log raw event; large fields (e.g. file content) go to the blob store
+        # and are handed to the full-text index separately
+        moved: List[str] = []
+        stored = self.blobs.externalize(payload, moved=moved)
+        self.log_episode(event.event_type, stored, "\n".join(moved) or None)
         # Stage for tick-time processing
-        self.enqueue_event(event)
+        return self.enqueue_event(event, force=force)
 
     def emit_goal_event(
         self, payload: Dict[str, Any], meta: Optional[Dict[str, Any]] = None
     ):
         """Goals emit events; kernel ingests them like perception."""
         ev = GoalEvent(payload=payload, meta=meta)
-        self.ingest_event(ev)
+        self.ingest_event(ev, force=True)
 
     def _process_event_queue(self) -> List[str]:
-        """Apply all queued events to the world in-order. Returns world-update notes."""
+        """
+        Apply queued events to the world in priority/FIFO order, within the
+        per-tick budget. Returns world-update notes.
+        """
         notes: List[str] = []
-        while self._event_queue:
-            ev = self._event_queue.pop(0)
+        budget = self._event_queue.drain(TICK_EVENT_BUDGET, TICK_EVENT_BUDGET_SECONDS)
+        for ev in budget:
             # update self-state about last event
             self.self_state.last_event_ts = getattr(
                 ev, "ts", datetime.utcnow().isoformat()
@@ -189,13 +512,14 @@ class Kernel:
                 ev, "event_type", type(ev).__name__
             )
             try:
-                ev_notes = apply_event(self.world, ev) or []
+                with self.profiler.phase("apply_event"):
+                    ev_notes = apply_event(self.world, ev) or []
+                self.profiler.count("events_processed")
                 if ev_notes:
                     notes.extend(ev_notes)
             except Exception as e:
                 # Enter safe mode on world update failure
-                self.safe_mode = True
-                self.log_episode(
+                self._enter_safe_mode(
                     "kernel_error",
                     {
                         "phase": "apply_event",
@@ -218,21 +542,7 @@ class Kernel:
         """Create or update a goal (storage only)."""
         now = datetime.utcnow().isoformat()
         meta_json = json.dumps(meta or {}, ensure_ascii=False)
-        cur = self.goals_conn.cursor()
-        cur.execute(
-            """
-            INSERT OR REPLACE INTO goals
-            (id, description, priority, status, created_ts, updated_ts, meta_json)
-            VALUES (
-                ?, ?, ?,
-                COALESCE((SELECT status FROM goals WHERE id=?), 'active'),
-                COALESCE((SELECT created_ts FROM goals WHERE id=?), ?),
-                ?, ?
-            )
-            """,
-            (goal_id, description, priority, goal_id, goal_id, now, now, meta_json),
-        )
-        self.goals_conn.commit()
+        self.goals.upsert(goal_id, description, priority, meta_json, now)
         self.self_state.active_goal_id = goal_id
         self._save_self_state()
         self.log_episode(
@@ -243,12 +553,7 @@ class Kernel:
     def update_goal_status(self, goal_id: str, status: str):
         """Update goal status. status ∈ {'active','paused','done','dropped'}"""
         now = datetime.utcnow().isoformat()
-        cur = self.goals_conn.cursor()
-        cur.execute(
-            "UPDATE goals SET status=?, updated_ts=? WHERE id=?",
-            (status, now, goal_id),
-        )
-        self.goals_conn.commit()
+        self.goals.set_status(goal_id, status, now)
         self.log_episode("goal_status", {"id": goal_id, "status": status})
 
     def set_active_goal(self, goal_id: Optional[str]):
@@ -257,76 +562,211 @@ class Kernel:
         self._save_self_state()
         self.log_episode("active_goal_set", {"goal_id": goal_id})
 
-    def register_goal_handler(self, goal_id: str, handler: GoalHandler):
-        """Register a deterministic handler for a specific goal id."""
+    def register_goal_handler(
+        self, goal_id: str, handler: GoalHandler, mode: ExecMode = "inline"
+    ):
+        """
+        Register a deterministic handler for a specific goal id.
+
+        "inline" handlers run on the tick thread and receive the kernel.
+        "io"/"cpu" handlers run in the executor's thread/process pool and
+        receive only the goal id (they must not touch kernel state).
+        "async" handlers (the default for `async def` handlers) are awaited
+        on the loop of kernel.async_runtime, between ticks, and receive the
+        kernel; while no loop is attached (plain step()/run loops) they are
+        skipped. Off-tick handlers' events are ingested on a later tick, one
+        run in flight per goal.
+        """
+        if mode == "inline" and inspect.iscoroutinefunction(handler):
+            mode = "async"
+        if mode not in EXEC_MODES:
+            raise ValueError(f"Invalid goal handler mode '{mode}'")
         self.goal_handlers[goal_id] = handler
+        self.goal_modes[goal_id] = mode
+        # a suspended run of the previous handler must not be resumed
+        self.goal_scheduler.forget(goal_id)
         self.log_episode("goal_handler_registered", {"goal_id": goal_id})
 
-    def run_active_goal(self):
-        """Execute the active goal handler once per tick; handlers emit events."""
-        gid = self.self_state.active_goal_id
-        if not gid:
-            return
+    def _runnable_goals(self) -> Dict[str, int]:
+        """Goal id -> priority for every goal the scheduler may run this tick."""
+        runnable: Dict[str, int] = {}
+        for gid in self.goal_handlers:
+            row = self.goals.get(gid)
+            if row is not None and row[3] == "active":
+                runnable[gid] = row[2]
 
-        handler = self.goal_handlers.get(gid)
-        if handler is None:
-            self.log_episode("goal_no_handler", {"goal_id": gid})
-            return
+        # the explicitly active goal runs even if it is not in goals.db
+        gid = self.self_state.active_goal_id
+        if gid and gid not in runnable:
+            if gid in self.goal_handlers:
+                row = self.goals.get(gid)
+                runnable[gid] = row[2] if row is not None else 0
+            else:
+                self.log_episode("goal_no_handler", {"goal_id": gid})
+        return runnable
 
-        try:
-            self.self_state.mode = "goal_exec"
-            out = handler(self)
+    def run_active_goal(self):
+        """
+        Run this tick's goal slices; handlers emit events.
+
+        Every active goal with a handler (plus self_state.active_goal_id) is
+        eligible; the goal scheduler picks them in priority-weighted order
+        until the tick's goal budget is spent.
+        """
+        runnable = self._runnable_goals()
+        started = time.perf_counter()
+        ran = 0
+        for gid in self.goal_scheduler.order(runnable):
+            if not self.goal_scheduler.budget_left(started, ran):
+                break
+            mode = self.goal_modes.get(gid, "inline")
+            if mode != "inline":
+                if gid in self._goal_jobs:
+                    continue
+                if mode == "async" and not self.executor.has_loop:
+                    # only this goal waits for a loop; the others keep running
+                    if gid not in self._goals_without_loop:
+                        self._goals_without_loop[gid] = None
+                        self.log_episode(
+                            "goal_skipped", {"goal_id": gid, "reason": "no_event_loop"}
+                        )
+                    continue
+                self._goals_without_loop.pop(gid, None)
+                try:
+                    self._submit_goal(gid, mode, runnable[gid])
+                except Exception as e:
+                    self._enter_safe_mode(
+                        "kernel_error",
+                        {"phase": "goal_submit", "goal_id": gid, "error": str(e)},
+                    )
+                    return
+                ran += 1
+                continue
+            try:
+                self.self_state.mode = "goal_exec"
+                s = self.goal_scheduler.run(
+                    gid, self.goal_handlers[gid], self, runnable[gid]
+                )
+            except Exception as e:
+                self._enter_safe_mode(
+                    "kernel_error",
+                    {"phase": "goal_exec", "goal_id": gid, "error": str(e)},
+                )
+                return
 
             # Normalize handler output into ingestion events
-            if out is None:
-                pass
-            elif isinstance(out, list):
-                for ev in out:
-                    self.ingest_event(ev)
-            else:
-                self.ingest_event(out)
+            for ev in s.events:
+                self.ingest_event(ev, force=True)
+            ran += 1
 
-            self.log_episode("goal_exec", {"goal_id": gid})
-        except Exception as e:
-            self.safe_mode = True
             self.log_episode(
-                "kernel_error",
-                {"phase": "goal_exec", "goal_id": gid, "error": str(e)},
+                "goal_exec",
+                {
+                    "goal_id": gid,
+                    "events": len(s.events),
+                    "seconds": round(s.seconds, 6),
+                    "finished": s.finished,
+                    "overrun": s.overrun,
+                },
+            )
+        self.profiler.count("goals_run", ran)
+
+    def _submit_goal(self, gid: str, mode: ExecMode, priority: int):
+        # only async handlers share the tick thread, so only they get the kernel
+        arg = self if mode == "async" else gid
+        job_id = self.executor.submit(
+            "goal", gid, self.goal_handlers[gid], arg, mode=mode
+        )
+        self._goal_jobs[gid] = job_id
+        self.goal_scheduler.charge(gid, priority)
+        self.log_episode(
+            "job_submitted",
+            {"job_id": job_id, "kind": "goal", "name": gid, "mode": mode},
+        )
+
+    def submit_tool(self, name: str, args: Dict[str, Any], **kw) -> int:
+        """Run an io/cpu tool off the tick thread; its result arrives as an event."""
+        job_id = self.tools.submit(name, args, **kw)
+        mode = self.tools.modes[name]
+        self.log_episode(
+            "job_submitted",
+            {"job_id": job_id, "kind": "tool", "name": name, "mode": mode},
+        )
+        return job_id
+
+    def cancel_job(self, job_id: int) -> bool:
+        """Cancel an executor job; the outcome is logged when it is collected."""
+        return self.executor.cancel(job_id)
+
+    def _collect_jobs(self):
+        """Ingest results of finished executor jobs, in submission order."""
+        for outcome in self.executor.poll():
+            self.log_episode(
+                "job_result",
+                {
+                    "job_id": outcome.job_id,
+                    "kind": outcome.kind,
+                    "name": outcome.name,
+                    "status": outcome.status,
+                    "seconds": round(outcome.seconds, 6),
+                    "error": outcome.error,
+                },
             )
+            if outcome.kind == "goal":
+                self._goal_jobs.pop(outcome.name, None)
+            if outcome.status == "ok":
+                for ev in self._job_events(outcome):
+                    self.ingest_event(ev, force=True)
+            elif outcome.status == "error" and outcome.kind == "goal":
+                self._enter_safe_mode(
+                    "kernel_error",
+                    {
+                        "phase": "goal_exec",
+                        "goal_id": outcome.name,
+                        "error": outcome.error,
+                    },
+                )
+
+    @staticmethod
+    def _job_events(outcome: JobOutcome) -> List[Any]:
+        if outcome.kind == "goal":
+            return handler_events(outcome.result)
+        return [
+            Event(
+                event_type="system",
+                source=f"tool:{outcome.name}",
+                payload={
+                    "tool": outcome.name,
+                    "job_id": outcome.job_id,
+                    "result": outcome.result,
+                },
+            )
+        ]
 
     def list_goals(self, status: Optional[str] = None):
         """List goals, optionally filtered by status, ordered by priority desc."""
-        cur = self.goals_conn.cursor()
-        if status:
-            rows = cur.execute(
-                "SELECT id, description, priority, status, created_ts, updated_ts, meta_json FROM goals WHERE status=? ORDER BY priority DESC",
-                (status,),
-            ).fetchall()
-        else:
-            rows = cur.execute(
-                "SELECT id, description, priority, status, created_ts, updated_ts, meta_json FROM goals ORDER BY priority DESC"
-            ).fetchall()
-        return rows
+        return self.goals.list(status)
 
     def list_active_goals_lowest_first(self):
         """Return active goals ordered by priority ascending (lowest first)."""
-        cur = self.goals_conn.cursor()
-        rows = cur.execute(
-            "SELECT id, description, priority, status, created_ts, updated_ts, meta_json FROM goals WHERE status='active' ORDER BY priority ASC"
-        ).fetchall()
-        return rows
+        return self.goals.list("active", descending=False)
 
     def list_paused_goals_highest_first(self):
         """Return paused goals ordered by priority descending (highest first)."""
-        cur = self.goals_conn.cursor()
-        rows = cur.execute(
-            "SELECT id, description, priority, status, created_ts, updated_ts, meta_json FROM goals WHERE status='paused' ORDER BY priority DESC"
-        ).fetchall()
-        return rows
+        return self.goals.list("paused")
 
     def step(self):
-        """One deterministic tick. No intelligence; just plumbing + self-state."""
+        """
+        One deterministic tick. No intelligence; just plumbing + self-state.
+        Each phase runs on its own cadence (see kernel.scheduler).
+        """
         now_ts = datetime.utcnow().isoformat()
+        sched = self.scheduler
+        sched.begin_tick()
+        prof = self.profiler
+        prof.begin_tick(now_ts)
+        bytes_before = self._bytes_written()
+        tick_start = time.perf_counter()
 
         # 0) heartbeat
         self.self_state.mode = "idle" if not self.safe_mode else "safe_mode"
@@ -334,68 +774,135 @@ class Kernel:
         self.log_episode("tick", {"msg": "heartbeat", "safe_mode": self.safe_mode})
         print(f"[{self.identity.name}] tick")
 
+        # 0.5) results of executor jobs submitted on earlier ticks
+        if len(self.executor):
+            with prof.phase("collect_jobs"):
+                self._collect_jobs()
+
         # 1) apply queued perception -> world
-        if self._event_queue:
-            self.self_state.mode = "ingesting"
-        self._process_event_queue()
+        if sched.due("ingest", dirty=bool(self._event_queue)):
+            if self._event_queue:
+                self.self_state.mode = "ingesting"
+            with prof.phase("queue_drain"):
+                self._process_event_queue()
+            sched.ran("ingest")
 
         # 2) consolidate world -> semantic (skip if in safe mode)
-        if not self.safe_mode:
+        if not self.safe_mode and sched.due(
+            "consolidate", dirty=self._consolidation_pending()
+        ):
             self.self_state.mode = "consolidating"
             try:
-                self.run_consolidation()
+                with prof.phase("run_consolidation"):
+                    self.run_consolidation()
             except Exception as e:
-                self.safe_mode = True
-                self.log_episode(
+                self._enter_safe_mode(
                     "kernel_error", {"phase": "consolidate", "error": str(e)}
                 )
+            sched.ran("consolidate")
 
         # 3) eval current state (skip if in safe mode)
         eval_record = None
-        if not self.safe_mode:
+        if not self.safe_mode and sched.due("eval"):
             self.self_state.mode = "evaluating"
             try:
-                eval_record = self.run_eval()
+                with prof.phase("run_eval"):
+                    eval_record = self.run_eval()
             except Exception as e:
-                self.safe_mode = True
-                self.log_episode("kernel_error", {"phase": "eval", "error": str(e)})
+                self._enter_safe_mode(
+                    "kernel_error", {"phase": "eval", "error": str(e)}
+                )
+            sched.ran("eval")
 
-        # 3.5) homeostasis reacts to eval deterministically
-        if not self.safe_mode:
+        # 3.5) homeostasis reacts to eval deterministically (eval cadence)
+        if not self.safe_mode and eval_record is not None:
             try:
-                self.run_homeostasis(eval_record)
+                with prof.phase("run_homeostasis"):
+                    self.run_homeostasis(eval_record)
             except Exception as e:
-                self.safe_mode = True
-                self.log_episode(
+                self._enter_safe_mode(
                     "kernel_error", {"phase": "homeostasis", "error": str(e)}
                 )
 
         # 3.8) execute active goal deterministically (v0)
-        if not self.safe_mode:
-            self.run_active_goal()
+        if not self.safe_mode and sched.due("goals"):
+            with prof.phase("run_active_goal"):
+                self.run_active_goal()
+            sched.ran("goals")
 
         # 4) safe-mode behavior: stay minimal until external reset
         if self.safe_mode:
             self.self_state.mode = "safe_mode"
             print(f"[{self.identity.name}] SAFE_MODE")
 
-        # 5) persist self-state snapshot
-        self._save_self_state()
+        # 5) persist self-state snapshot (the tick's only self-state write)
+        with prof.phase("save_self_state"):
+            self._save_self_state()
+            self._flush_self_state()
+
+        # 6) group-commit this tick's episodes + metrics in one transaction
+        prof.count("queue_depth", len(self._event_queue))
+        prof.count("bytes_written", self._bytes_written() - bytes_before)
+        prof.count("tick.seconds", time.perf_counter() - tick_start)
+        prof.end_tick()
+        prof.write(self.conn)
+        self.episodes.flush()
+        sched.end_tick()
+
+        # 7) periodic checkpoint (only when the queue is drained)
+        self.maybe_checkpoint()
+
+    def _bytes_written(self) -> int:
+        """
+        Cumulative bytes handed to every writer: tape payloads, world and
+        semantic journals/snapshots, eval log and self-state. State that was
+        never hydrated has written nothing.
+        """
+        total = self.episodes.bytes_written + self._self_state_bytes
+        for store in (self._world, self._semantic, self._eval_store):
+            if store is not None:
+                total += store.bytes_written
+        return total
 
     def shutdown(self):
         try:
+            abandoned = self.executor.shutdown()
+            if abandoned:
+                self.log_episode("executor_shutdown", {"abandoned_jobs": abandoned})
+            # consolidate what is left so the final checkpoint can be taken
+            if self._consolidation_feed and not self.safe_mode:
+                try:
+                    self.run_consolidation()
+                except Exception as e:
+                    self.log_episode(
+                        "kernel_error", {"phase": "consolidate", "error": str(e)}
+                    )
+            self.maybe_checkpoint(force=True)
+            self._flush_self_state()
+            self.episodes.flush()
             self.conn.close()
         finally:
             self.goals_conn.close()
 
+    def _consolidation_pending(self) -> bool:
+        # hydrate first: until then the feed is None, yet the loaded world
+        # may hold changes that were never consolidated
+        self.world
+        return bool(self._consolidation_feed)
+
     def run_consolidation(self):
-        notes = consolidate(self.world, self.semantic)
+        if not self._consolidation_pending():
+            return
+        notes = consolidate(
+            self.world, self.semantic, self._consolidation_feed.drain()
+        )
+        self.profiler.count("facts_touched", len(notes))
         if notes:
             self.semantic.save()
             self.log_episode("semantic_update", {"notes": notes})
 
     def run_eval(self):
-        r = run_coherence_eval(self.world, self.semantic)
+        r = self.coherence.evaluate()
         self.eval_store.add_record(r)
         self.eval_store.save()
         self.log_episode(
@@ -428,8 +935,7 @@ class Kernel:
         if isinstance(score, (int, float)):
             # If coherence is too low, enter SAFE_MODE
             if score < HOMEOSTASIS_MIN_COHERENCE:
-                self.safe_mode = True
-                self.log_episode(
+                self._enter_safe_mode(
                     "homeostasis_trigger",
                     {
                         "reason": "low_coherence",
@@ -440,14 +946,12 @@ class Kernel:
 
             # Warning band: pause lowest-priority active goals first to reduce load
             elif score < HOMEOSTASIS_WARN_COHERENCE:
-                active_goals = self.list_active_goals_lowest_first()
+                # Pause at most 1 goal per tick in v1
+                lowest = self.goals.lowest("active")
                 paused_ids = []
-                for row in active_goals:
-                    goal_id = row[0]
-                    self.update_goal_status(goal_id, "paused")
-                    paused_ids.append(goal_id)
-                    # Pause at most 1 goal per tick in v1
-                    break
+                if lowest is not None:
+                    self.update_goal_status(lowest[0], "paused")
+                    paused_ids.append(lowest[0])
 
                 if paused_ids:
                     # If the paused goal was the active one, clear active_goal_id
@@ -464,9 +968,9 @@ class Kernel:
                     score >= HOMEOSTASIS_RESUME_COHERENCE
                     and not self.self_state.active_goal_id
                 ):
-                    paused = self.list_paused_goals_highest_first()
-                    if paused:
-                        resume_id = paused[0][0]
+                    paused = self.goals.highest("paused")
+                    if paused is not None:
+                        resume_id = paused[0]
                         self.update_goal_status(resume_id, "active")
                         self.set_active_goal(resume_id)
                         self.log_episode(
@@ -492,7 +996,7 @@ def main(max_ticks: int = 5):
     try:
         from kernel.tick import run_tick_loop
 
-        run_tick_loop(k.step, max_ticks=max_ticks)
+        run_tick_loop(k.step, max_ticks=max_ticks, rate_hz=TICK_RATE_HZ)
     finally:
         k.shutdown()
 
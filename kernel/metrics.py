@@ -0,0 +1,144 @@
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Phase wall-time thresholds (seconds) for the health_metrics status column
+PHASE_WARN_SECONDS = 0.1
+PHASE_FAIL_SECONDS = 1.0
+
+# Suffix of wall-time metrics; other metrics are counters (events, bytes, ...)
+SECONDS_SUFFIX = ".seconds"
+
+# Keep raw health_metrics rows this long, then fold them into
+# health_metrics_rollup buckets (count/min/mean/max per metric)
+HEALTH_METRICS_RETENTION_HOURS = 24
+HEALTH_METRICS_ROLLUP_BUCKET_SECONDS = 3600
+
+
+def _status(metric_name: str, value: float) -> str:
+    if not metric_name.endswith(SECONDS_SUFFIX):
+        return "OK"
+    if value >= PHASE_FAIL_SECONDS:
+        return "FAIL"
+    if value >= PHASE_WARN_SECONDS:
+        return "WARN"
+    return "OK"
+
+
+def _bucket_start(ts: datetime, bucket_seconds: int) -> datetime:
+    secs = int((ts - datetime(1970, 1, 1)).total_seconds())
+    return datetime(1970, 1, 1) + timedelta(seconds=secs - secs % bucket_seconds)
+
+
+class TickProfiler:
+    """
+    Per-tick phase timings and counters, buffered as health_metrics rows.
+
+    Phase timings are recorded as "<phase>.seconds" (accumulated if a phase
+    runs more than once per tick); counters via count(). write() inserts the
+    buffered rows without committing so they land in the same transaction as
+    the tick's episodes, and rolls up rows past retention about once per
+    rollup bucket.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        retention_hours: float = HEALTH_METRICS_RETENTION_HOURS,
+        bucket_seconds: int = HEALTH_METRICS_ROLLUP_BUCKET_SECONDS,
+    ):
+        self.enabled = enabled
+        self.retention = timedelta(hours=retention_hours)
+        self.bucket_seconds = bucket_seconds
+        self._tick_id: Optional[str] = None
+        self._values: Dict[str, float] = {}
+        self._rows: List[Tuple[str, str, float, str, str]] = []
+        self._next_compact = 0.0  # time.monotonic() of the next compact()
+
+    def begin_tick(self, tick_id: str):
+        self._tick_id = tick_id
+        self._values = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.count(name + SECONDS_SUFFIX, time.perf_counter() - start)
+
+    def count(self, metric_name: str, value: float = 1):
+        if self.enabled:
+            self._values[metric_name] = self._values.get(metric_name, 0) + value
+
+    def end_tick(self):
+        if not self.enabled or self._tick_id is None:
+            return
+        now = datetime.utcnow().isoformat()
+        for name, value in self._values.items():
+            self._rows.append((self._tick_id, name, value, _status(name, value), now))
+        self._tick_id = None
+        self._values = {}
+
+    def write(self, conn: sqlite3.Connection) -> int:
+        if not self._rows:
+            return 0
+        rows = self._rows
+        conn.executemany(
+            "INSERT INTO health_metrics "
+            "(tick_id, metric_name, metric_value, status, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._rows = []
+        if time.monotonic() >= self._next_compact:
+            self.compact(conn)
+            self._next_compact = time.monotonic() + self.bucket_seconds
+        return len(rows)
+
+    def compact(self, conn: sqlite3.Connection, now: Optional[datetime] = None) -> int:
+        """
+        Fold health_metrics rows older than the retention cutoff into
+        health_metrics_rollup and delete them. The cutoff is bucket-aligned
+        so every bucket is written exactly once. Rows are time-ordered by id,
+        so only the rolled-up prefix of the table is scanned. Returns rows
+        removed; does not commit.
+        """
+        cutoff = _bucket_start(
+            (now or datetime.utcnow()) - self.retention, self.bucket_seconds
+        ).isoformat()
+        oldest = conn.execute(
+            "SELECT created_at FROM health_metrics ORDER BY id LIMIT 1"
+        ).fetchone()
+        if oldest is None or oldest[0] >= cutoff:
+            return 0
+        first_kept = conn.execute(
+            "SELECT id FROM health_metrics WHERE created_at >= ? ORDER BY id LIMIT 1",
+            (cutoff,),
+        ).fetchone()
+        if first_kept is not None:
+            end = first_kept[0]
+        else:
+            end = conn.execute("SELECT MAX(id) + 1 FROM health_metrics").fetchone()[0]
+        b = self.bucket_seconds
+        # a bucket already rolled up (clock stepped back) is merged, not lost
+        conn.execute(
+            "INSERT INTO health_metrics_rollup "
+            "(metric_name, bucket_start, bucket_seconds, count, min, mean, max) "
+            "SELECT metric_name, strftime('%Y-%m-%dT%H:%M:%S', "
+            "(CAST(strftime('%s', created_at) AS INTEGER) / ?) * ?, 'unixepoch'), "
+            "?, COUNT(*), MIN(metric_value), AVG(metric_value), MAX(metric_value) "
+            "FROM health_metrics WHERE id < ? GROUP BY 1, 2 "
+            "ON CONFLICT (metric_name, bucket_start) DO UPDATE SET "
+            "mean = (mean * count + excluded.mean * excluded.count) "
+            "/ (count + excluded.count), "
+            "count = count + excluded.count, "
+            "min = MIN(min, excluded.min), max = MAX(max, excluded.max)",
+            (b, b, b, end),
+        )
+        return conn.execute("DELETE FROM health_metrics WHERE id < ?", (end,)).rowcount
@@ -0,0 +1,126 @@
+import time
+from typing import Dict, Optional
+from pydantic import BaseModel
+
+
+class PhaseCadence(BaseModel):
+    """How often a Kernel.step phase runs."""
+
+    every_ticks: int = 1  # run at most once per N ticks...
+    every_seconds: Optional[float] = None  # ...and at most once per N seconds
+    when_dirty: bool = False  # run early whenever the phase has pending work
+    skippable: bool = True  # may be deferred when the tick is over budget
+
+
+# Default: every phase every tick (the v0 behavior). Example of a cheaper
+# heartbeat: {"consolidate": PhaseCadence(every_ticks=10, when_dirty=True),
+#             "eval": PhaseCadence(every_ticks=1, every_seconds=30)}
+DEFAULT_PHASE_CADENCES: Dict[str, PhaseCadence] = {
+    "ingest": PhaseCadence(skippable=False),
+    "consolidate": PhaseCadence(),
+    "eval": PhaseCadence(),  # homeostasis runs whenever eval does
+    "goals": PhaseCadence(),
+}
+
+
+class TickStats:
+    """Running heartbeat statistics: pacing jitter, overruns, skipped phases."""
+
+    def __init__(self):
+        self.ticks = 0
+        self.overruns = 0
+        self.missed_slots = 0
+        self.jitter_total = 0.0
+        self.jitter_max = 0.0
+        self.duration_total = 0.0
+        self.duration_max = 0.0
+        self.phase_runs: Dict[str, int] = {}
+        self.phase_skips: Dict[str, int] = {}
+
+    def record_tick(
+        self, duration: float, jitter: float = 0.0, overrun: bool = False
+    ):
+        self.ticks += 1
+        self.duration_total += duration
+        self.duration_max = max(self.duration_max, duration)
+        self.jitter_total += jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+        if overrun:
+            self.overruns += 1
+
+    def summary(self) -> Dict[str, object]:
+        n = max(self.ticks, 1)
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "missed_slots": self.missed_slots,
+            "jitter_mean": self.jitter_total / n,
+            "jitter_max": self.jitter_max,
+            "duration_mean": self.duration_total / n,
+            "duration_max": self.duration_max,
+            "phase_runs": dict(self.phase_runs),
+            "phase_skips": dict(self.phase_skips),
+        }
+
+
+class PhaseScheduler:
+    """
+    Decides which Kernel.step phases run on a tick.
+
+    A phase is due once its tick and time cadences have both elapsed, or
+    immediately when when_dirty is set and it has pending work. A due,
+    skippable phase is deferred (and stays due) if the tick has already
+    used up budget_seconds, so an overrunning tick coalesces expensive
+    phases into a later one instead of stretching further.
+    """
+
+    def __init__(
+        self,
+        cadences: Optional[Dict[str, PhaseCadence]] = None,
+        budget_seconds: Optional[float] = None,
+    ):
+        self.cadences = dict(DEFAULT_PHASE_CADENCES)
+        self.cadences.update(cadences or {})
+        self.budget_seconds = budget_seconds
+        self.stats = TickStats()
+        self.tick = 0
+        self._tick_start = time.monotonic()
+        self._last_tick: Dict[str, int] = {}
+        self._last_time: Dict[str, float] = {}
+
+    def begin_tick(self):
+        self.tick += 1
+        self._tick_start = time.monotonic()
+
+    def end_tick(self):
+        duration = time.monotonic() - self._tick_start
+        overrun = self.budget_seconds is not None and duration > self.budget_seconds
+        self.stats.record_tick(duration, overrun=overrun)
+
+    def over_budget(self) -> bool:
+        if self.budget_seconds is None:
+            return False
+        return time.monotonic() - self._tick_start > self.budget_seconds
+
+    def due(self, phase: str, dirty: bool = False) -> bool:
+        cad = self.cadences.get(phase, PhaseCadence())
+        last_tick = self._last_tick.get(phase)
+        if last_tick is None:
+            cadence_due = True
+        else:
+            cadence_due = self.tick - last_tick >= cad.every_ticks
+            if cadence_due and cad.every_seconds is not None:
+                elapsed = time.monotonic() - self._last_time[phase]
+                cadence_due = elapsed >= cad.every_seconds
+
+        if not (cadence_due or (cad.when_dirty and dirty)):
+            return False
+        if cad.skippable and self.over_budget():
+            self.stats.phase_skips[phase] = self.stats.phase_skips.get(phase, 0) + 1
+            return False
+        return True
+
+    def ran(self, phase: str):
+        self._last_tick[phase] = self.tick
+        self._last_time[phase] = time.monotonic()
+        self.stats.phase_runs[phase] = self.stats.phase_runs.get(phase, 0) + 1
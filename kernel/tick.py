@@ -1,15 +1,46 @@
+import time
 from typing import Callable, Optional
+from kernel.scheduler import TickStats
 
-def run_tick_loop(step_fn: Callable[[], None], max_ticks: Optional[int] = None):
+
+def run_tick_loop(
+    step_fn: Callable[[], None],
+    max_ticks: Optional[int] = None,
+    rate_hz: Optional[float] = None,
+    stats: Optional[TickStats] = None,
+) -> TickStats:
     """
     Deterministic heartbeat loop.
     - step_fn: called every tick
     - max_ticks: None => run forever, else stop after N ticks
+    - rate_hz: None => back-to-back ticks, else fixed-rate pacing. A tick that
+      overruns its period is counted; missed slots are skipped rather than
+      replayed in a burst.
+    - stats: optional TickStats to accumulate jitter/overrun figures into
     """
+    stats = stats if stats is not None else TickStats()
+    period = (1.0 / rate_hz) if rate_hz else None
+    next_start = time.monotonic()
     tick_count = 0
     while True:
+        start = time.monotonic()
+        jitter = max(0.0, start - next_start) if period else 0.0
         step_fn()
+        end = time.monotonic()
         tick_count += 1
 
+        overrun = period is not None and end - start > period
+        stats.record_tick(end - start, jitter=jitter, overrun=overrun)
+
         if max_ticks is not None and tick_count >= max_ticks:
-            break
\ No newline at end of file
+            break
+
+        if period is not None:
+            next_start += period
+            if next_start < end:
+                # fell behind: resync to the next slot boundary after now
+                missed = int((end - next_start) // period) + 1
+                stats.missed_slots += missed
+                next_start += missed * period
+            time.sleep(max(0.0, next_start - time.monotonic()))
+    return stats
@@ -0,0 +1,17 @@
+import os
+from pathlib import Path
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> int:
+    """
+    Write via temp file + fsync + rename so readers never see a partial file.
+    Returns the number of bytes written.
+    """
+    data = text.encode(encoding)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return len(data)
@@ -0,0 +1,130 @@
+import hashlib
+import sqlite3
+import zlib
+from typing import Any, Dict, List, Optional
+
+try:  # optional, better ratio/speed than zlib when installed
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+# String payload fields larger than this are moved into the blob store.
+BLOB_INLINE_MAX_BYTES = 4096
+BLOB_ZLIB_LEVEL = 6
+
+# Marker key for a payload field that was replaced by a blob reference.
+BLOB_REF_KEY = "$blob"
+
+
+class BlobStore:
+    """
+    Content-addressed blob storage inside the episodic database.
+
+    Blobs are keyed by the sha256 of their raw bytes, so storing the same
+    content twice is a no-op. Writes join the connection's open transaction
+    and are committed together with the episodes that reference them.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                codec TEXT NOT NULL,
+                data BLOB NOT NULL
+            )
+            """
+        )
+        conn.commit()
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        cur = self.conn.execute("SELECT 1 FROM blobs WHERE hash=?", (digest,))
+        if cur.fetchone():
+            return digest
+
+        if zstandard is not None:
+            codec, packed = "zstd", zstandard.ZstdCompressor().compress(data)
+        else:
+            codec, packed = "zlib", zlib.compress(data, BLOB_ZLIB_LEVEL)
+        if len(packed) >= len(data):
+            codec, packed = "raw", data
+
+        self.conn.execute(
+            "INSERT OR IGNORE INTO blobs (hash, size, codec, data) VALUES (?, ?, ?, ?)",
+            (digest, len(data), codec, packed),
+        )
+        return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        row = self.conn.execute(
+            "SELECT codec, data FROM blobs WHERE hash=?", (digest,)
+        ).fetchone()
+        if row is None:
+            return None
+        codec, packed = row
+        if codec == "zlib":
+            return zlib.decompress(packed)
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError(
+                    "blob is zstd-compressed but zstandard is not installed"
+                )
+            return zstandard.ZstdDecompressor().decompress(packed)
+        return bytes(packed)
+
+    def externalize(
+        self,
+        payload: Dict[str, Any],
+        max_inline: int = BLOB_INLINE_MAX_BYTES,
+        moved: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Copy of payload with large string fields replaced by blob references.
+        The replaced strings are appended to moved, when given.
+        """
+        out: Dict[str, Any] = {}
+        for key, value in payload.items():
+            if isinstance(value, dict):
+                out[key] = self.externalize(value, max_inline, moved)
+            elif isinstance(value, str) and len(value) > max_inline // 4:
+                # cheap length check first; encode only plausible candidates
+                data = value.encode("utf-8")
+                if len(data) > max_inline:
+                    out[key] = {BLOB_REF_KEY: self.put(data), "size": len(data)}
+                    if moved is not None:
+                        moved.append(value)
+                else:
+                    out[key] = value
+            else:
+                out[key] = value
+        return out
+
+    def resolve(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Inverse of externalize: inline the content of blob references."""
+        out: Dict[str, Any] = {}
+        for key, value in payload.items():
+            if isinstance(value, dict) and BLOB_REF_KEY in value:
+                data = self.get(value[BLOB_REF_KEY])
+                out[key] = data.decode("utf-8") if data is not None else None
+            elif isinstance(value, dict):
+                out[key] = self.resolve(value)
+            else:
+                out[key] = value
+        return out
+
+    def search_text(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Text of the blobs payload references, one per line (None if none)."""
+        texts: List[str] = []
+        for value in payload.values():
+            if isinstance(value, dict) and BLOB_REF_KEY in value:
+                data = self.get(value[BLOB_REF_KEY])
+                if data is not None:
+                    texts.append(data.decode("utf-8"))
+            elif isinstance(value, dict):
+                text = self.search_text(value)
+                if text is not None:
+                    texts.append(text)
+        return "\n".join(texts) if texts else None
@@ -0,0 +1,357 @@
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from pydantic import BaseModel
+
+from memory.blob_store import BLOB_REF_KEY, BlobStore
+
+# Rows fetched per keyset page while streaming
+EPISODIC_PAGE_SIZE = 1_000
+# Rows per transaction when backfilling ts_unix on an existing tape
+EPISODIC_BACKFILL_BATCH = 50_000
+
+# Accepted time bounds: unix seconds, a datetime (naive => UTC) or an ISO string
+TimeBound = Union[float, int, datetime, str]
+# Keyset cursor: (ts_unix, id) of the last row returned
+Cursor = Tuple[float, int]
+
+_COLUMNS = "e.id, e.ts, e.ts_unix, e.event_type, e.payload_json"
+# LIKE pattern for a payload_json that holds at least one blob reference
+_BLOB_REF_PATTERN = f'%"{BLOB_REF_KEY}"%'
+
+
+def to_unix(ts: TimeBound) -> float:
+    """Normalize a time bound to unix seconds; naive datetimes are UTC."""
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    if isinstance(ts, str):
+        ts = datetime.fromisoformat(ts)
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def init_episodic_schema(conn: sqlite3.Connection):
+    """
+    Read-side schema for the episodes table: a numeric ts_unix column
+    (backfilled from the ISO ts), (event_type, ts_unix) and ts_unix
+    indexes, and a contentless FTS5 index over payload_json plus the text
+    of the payload's blobs (blob_text). Triggers index payload_json; the
+    writer adds blob_text, which the tape itself only holds as blob
+    references. Idempotent; safe to run on every start.
+    """
+    cols = [row[1] for row in conn.execute("PRAGMA table_info(episodes)")]
+    if "ts_unix" not in cols:
+        with conn:
+            conn.execute("ALTER TABLE episodes ADD COLUMN ts_unix REAL")
+    _backfill_ts_unix(conn)
+
+    with conn:
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_episodes_type_ts "
+            "ON episodes(event_type, ts_unix)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_episodes_ts ON episodes(ts_unix)"
+        )
+
+    if not fts5_available(conn):
+        return
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type='table' AND name='episodes_fts'"
+    ).fetchone()
+    if row is not None and "blob_text" not in row[0]:
+        # older external-content index over payload_json only: replace it
+        with conn:
+            for trigger in ("episodes_fts_ai", "episodes_fts_ad", "episodes_fts_au"):
+                conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            conn.execute("DROP TABLE episodes_fts")
+        row = None
+    with conn:
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS episodes_fts USING fts5("
+            "payload_json, blob_text, content='')"
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS episodes_fts_ai
+            AFTER INSERT ON episodes BEGIN
+                INSERT INTO episodes_fts(rowid, payload_json)
+                VALUES (new.id, new.payload_json);
+            END
+            """
+        )
+        # a contentless 'delete' must repeat the indexed values exactly and
+        # blob_text is not on the row, so episodes with blob references keep
+        # their entries (search() joins on episodes; ids are never reused)
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS episodes_fts_ad
+            AFTER DELETE ON episodes
+            WHEN old.payload_json NOT LIKE '{_BLOB_REF_PATTERN}' BEGIN
+                INSERT INTO episodes_fts(episodes_fts, rowid, payload_json)
+                VALUES ('delete', old.id, old.payload_json);
+            END
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS episodes_fts_au
+            AFTER UPDATE OF payload_json ON episodes
+            WHEN old.payload_json NOT LIKE '{_BLOB_REF_PATTERN}' BEGIN
+                INSERT INTO episodes_fts(episodes_fts, rowid, payload_json)
+                VALUES ('delete', old.id, old.payload_json);
+                INSERT INTO episodes_fts(rowid, payload_json)
+                VALUES (new.id, new.payload_json);
+            END
+            """
+        )
+        if row is None:
+            # index the tape written before the FTS table existed
+            conn.execute(
+                "INSERT INTO episodes_fts(rowid, payload_json) "
+                "SELECT id, payload_json FROM episodes "
+                f"WHERE payload_json NOT LIKE '{_BLOB_REF_PATTERN}'"
+            )
+            _index_blob_episodes(conn)
+
+
+def _index_blob_episodes(conn: sqlite3.Connection):
+    # episodes with blob references, indexed with their blob text
+    blobs = BlobStore(conn)
+    cur = conn.execute(
+        "SELECT id, payload_json FROM episodes "
+        f"WHERE payload_json LIKE '{_BLOB_REF_PATTERN}'"
+    )
+    for rows in iter(lambda: cur.fetchmany(EPISODIC_PAGE_SIZE), []):
+        conn.executemany(
+            "INSERT INTO episodes_fts(rowid, payload_json, blob_text) "
+            "VALUES (?, ?, ?)",
+            [
+                (id_, payload_json, blobs.search_text(json.loads(payload_json)))
+                for id_, payload_json in rows
+            ],
+        )
+
+
+def _backfill_ts_unix(conn: sqlite3.Connection):
+    # julianday() parses the ISO strings the writer produces (UTC, no offset)
+    while True:
+        with conn:
+            cur = conn.execute(
+                "UPDATE episodes SET ts_unix = (julianday(ts) - 2440587.5) * 86400.0 "
+                "WHERE id IN (SELECT id FROM episodes WHERE ts_unix IS NULL LIMIT ?)",
+                (EPISODIC_BACKFILL_BATCH,),
+            )
+        if cur.rowcount < EPISODIC_BACKFILL_BATCH:
+            return
+
+
+class Episode(BaseModel):
+    id: int
+    ts: str
+    ts_unix: Optional[float]
+    event_type: str
+    payload: Dict[str, Any]
+
+
+class EpisodePage(NamedTuple):
+    episodes: List[Episode]
+    cursor: Optional[Cursor]  # pass back to page() for the next page; None => done
+
+
+def _row_to_episode(row: Tuple[Any, ...]) -> Episode:
+    return Episode(
+        id=row[0],
+        ts=row[1],
+        ts_unix=row[2],
+        event_type=row[3],
+        payload=json.loads(row[4]) if row[4] else {},
+    )
+
+
+class EpisodicMemory:
+    """
+    Read API over the episodic tape.
+
+    Rows are ordered by (ts_unix, id) and paged with a keyset cursor, so
+    iterating a large tape streams page by page on an index instead of
+    materializing or OFFSET-scanning it. Only committed episodes are
+    visible; the kernel's writer commits once per tick.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.has_fts = bool(
+            conn.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type='table' AND name='episodes_fts'"
+            ).fetchone()
+        )
+
+    @classmethod
+    def open(cls, db_path: str) -> "EpisodicMemory":
+        """Open a separate read-only connection (e.g. from a debugging script)."""
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        return cls(conn)
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def _where(
+        event_types: Optional[Sequence[str]],
+        since: Optional[TimeBound],
+        until: Optional[TimeBound],
+    ) -> Tuple[List[str], List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if event_types is not None:
+            event_types = list(event_types)
+            if not event_types:
+                clauses.append("0")
+            else:
+                clauses.append(
+                    "e.event_type IN (" + ",".join("?" * len(event_types)) + ")"
+                )
+                params.extend(event_types)
+        if since is not None:
+            clauses.append("e.ts_unix >= ?")
+            params.append(to_unix(since))
+        if until is not None:
+            clauses.append("e.ts_unix < ?")
+            params.append(to_unix(until))
+        return clauses, params
+
+    def page(
+        self,
+        event_types: Optional[Sequence[str]] = None,
+        since: Optional[TimeBound] = None,
+        until: Optional[TimeBound] = None,
+        cursor: Optional[Cursor] = None,
+        limit: int = EPISODIC_PAGE_SIZE,
+        descending: bool = False,
+    ) -> EpisodePage:
+        """One page of episodes in time order, starting after cursor."""
+        clauses, params = self._where(event_types, since, until)
+        if cursor is not None:
+            op = "<" if descending else ">"
+            clauses.append(f"(e.ts_unix, e.id) {op} (?, ?)")
+            params.extend(cursor)
+        order = "DESC" if descending else "ASC"
+        sql = f"SELECT {_COLUMNS} FROM episodes e"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY e.ts_unix {order}, e.id {order} LIMIT ?"
+        rows = self.conn.execute(sql, params + [limit]).fetchall()
+        episodes = [_row_to_episode(r) for r in rows]
+        next_cursor = (rows[-1][2], rows[-1][0]) if len(rows) == limit else None
+        return EpisodePage(episodes, next_cursor)
+
+    def iter_episodes(
+        self,
+        event_types: Optional[Sequence[str]] = None,
+        since: Optional[TimeBound] = None,
+        until: Optional[TimeBound] = None,
+        descending: bool = False,
+        page_size: int = EPISODIC_PAGE_SIZE,
+    ) -> Iterator[Episode]:
+        """Stream matching episodes page by page."""
+        cursor: Optional[Cursor] = None
+        while True:
+            page = self.page(event_types, since, until, cursor, page_size, descending)
+            yield from page.episodes
+            if page.cursor is None:
+                return
+            cursor = page.cursor
+
+    def iter_after_id(
+        self,
+        after_id: int,
+        event_types: Optional[Sequence[str]] = None,
+        page_size: int = EPISODIC_PAGE_SIZE,
+    ) -> Iterator[Episode]:
+        """Stream episodes with id > after_id in tape (id) order."""
+        clauses, params = self._where(event_types, None, None)
+        clauses.append("e.id > ?")
+        sql = (
+            f"SELECT {_COLUMNS} FROM episodes e WHERE "
+            + " AND ".join(clauses)
+            + " ORDER BY e.id LIMIT ?"
+        )
+        last = after_id
+        while True:
+            rows = self.conn.execute(sql, params + [last, page_size]).fetchall()
+            for r in rows:
+                yield _row_to_episode(r)
+            if len(rows) < page_size:
+                return
+            last = rows[-1][0]
+
+    def last(
+        self, n: int = 20, event_types: Optional[Sequence[str]] = None
+    ) -> List[Episode]:
+        """The n most recent episodes, newest first."""
+        return self.page(event_types, limit=n, descending=True).episodes
+
+    def count(
+        self,
+        event_types: Optional[Sequence[str]] = None,
+        since: Optional[TimeBound] = None,
+        until: Optional[TimeBound] = None,
+    ) -> int:
+        clauses, params = self._where(event_types, since, until)
+        sql = "SELECT COUNT(*) FROM episodes e"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return self.conn.execute(sql, params).fetchone()[0]
+
+    def max_id(self) -> int:
+        row = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM episodes").fetchone()
+        return row[0]
+
+    def search(
+        self,
+        query: str,
+        event_types: Optional[Sequence[str]] = None,
+        since: Optional[TimeBound] = None,
+        until: Optional[TimeBound] = None,
+        limit: int = 50,
+    ) -> List[Episode]:
+        """
+        Full-text search over payloads, including the text of fields moved
+        to the blob store (FTS5 query syntax), best match first.
+        """
+        if not self.has_fts:
+            raise RuntimeError("episodes_fts unavailable (SQLite built without FTS5)")
+        clauses, params = self._where(event_types, since, until)
+        clauses.insert(0, "episodes_fts MATCH ?")
+        params.insert(0, query)
+        sql = (
+            f"SELECT {_COLUMNS} FROM episodes_fts "
+            "JOIN episodes e ON e.id = episodes_fts.rowid WHERE "
+            + " AND ".join(clauses)
+            + " ORDER BY episodes_fts.rank LIMIT ?"
+        )
+        rows = self.conn.execute(sql, params + [limit]).fetchall()
+        return [_row_to_episode(r) for r in rows]
@@ -0,0 +1,122 @@
+import json
+import sqlite3
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Flush thresholds: whichever is hit first triggers a group commit.
+EPISODIC_FLUSH_MAX_BATCH = 500
+EPISODIC_FLUSH_MAX_AGE_SECONDS = 1.0
+
+# SQLite durability level for the episodic tape (OFF | NORMAL | FULL | EXTRA).
+# NORMAL under WAL only fsyncs at checkpoints, which is the point of batching.
+EPISODIC_SYNCHRONOUS = "NORMAL"
+_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def configure_wal(conn: sqlite3.Connection, synchronous: str = EPISODIC_SYNCHRONOUS):
+    """Switch the connection to WAL journaling with the given synchronous level."""
+    level = synchronous.upper()
+    if level not in _SYNCHRONOUS_LEVELS:
+        raise ValueError(f"Invalid synchronous level '{synchronous}'")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(f"PRAGMA synchronous={level}")
+
+
+class EpisodicWriter:
+    """
+    Buffered, group-committed writer for the episodic tape.
+
+    Episodes are held in memory and written in a single executemany
+    transaction on flush(). The kernel flushes once per tick, on shutdown
+    and before entering SAFE_MODE; the size/age thresholds bound how much
+    can be pending between those points.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        max_batch: int = EPISODIC_FLUSH_MAX_BATCH,
+        max_age_seconds: float = EPISODIC_FLUSH_MAX_AGE_SECONDS,
+    ):
+        self.conn = conn
+        self.max_batch = max_batch
+        self.max_age_seconds = max_age_seconds
+        self._pending: List[Tuple[str, float, str, str]] = []
+        # (index into _pending, text of its blobs) for the FTS blob_text column
+        self._blob_texts: List[Tuple[int, str]] = []
+        self._oldest: Optional[float] = None
+        self.has_fts = bool(
+            conn.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type='table' AND name='episodes_fts'"
+            ).fetchone()
+        )
+        self.bytes_written = 0  # cumulative payload bytes handed to the tape
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def append(
+        self, event_type: str, payload: Dict[str, Any], blob_text: Optional[str] = None
+    ):
+        """
+        Buffer an episode. blob_text is the content of the fields the payload
+        holds as blob references, so full-text search can find it.
+        """
+        now = datetime.now(timezone.utc)
+        ts = now.replace(tzinfo=None).isoformat()
+        payload_json = json.dumps(payload, ensure_ascii=False)
+        if blob_text and self.has_fts:
+            self._blob_texts.append((len(self._pending), blob_text))
+        self._pending.append((ts, now.timestamp(), event_type, payload_json))
+        self.bytes_written += len(payload_json.encode("utf-8"))
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+        if len(self._pending) >= self.max_batch or (
+            time.monotonic() - self._oldest >= self.max_age_seconds
+        ):
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all pending episodes in one transaction, together with any
+        other writes already open on the connection. Returns rows written.
+        """
+        if not self._pending:
+            if self.conn.in_transaction:
+                self.conn.commit()
+            return 0
+        rows = self._pending
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO episodes (ts, ts_unix, event_type, payload_json) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            if self._blob_texts:
+                self._index_blob_texts(rows)
+        self._pending = []
+        self._blob_texts = []
+        self._oldest = None
+        return len(rows)
+
+    def _index_blob_texts(self, rows: List[Tuple[str, float, str, str]]):
+        # ids are AUTOINCREMENT, so the batch just inserted ends at seq
+        last = self.conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name='episodes'"
+        ).fetchone()[0]
+        first = last - len(rows) + 1
+        # the insert trigger indexed payload_json alone: re-index with blob_text
+        entries = [(first + i, rows[i][3], text) for i, text in self._blob_texts]
+        self.conn.executemany(
+            "INSERT INTO episodes_fts(episodes_fts, rowid, payload_json) "
+            "VALUES ('delete', ?, ?)",
+            [(id_, payload_json) for id_, payload_json, _ in entries],
+        )
+        self.conn.executemany(
+            "INSERT INTO episodes_fts(rowid, payload_json, blob_text) "
+            "VALUES (?, ?, ?)",
+            entries,
+        )
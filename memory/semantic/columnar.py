@@ -0,0 +1,202 @@
+import os
+from array import array
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+try:  # optional: bulk consolidation/coherence fall back to the row path
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+from .memory import SemanticMemory
+
+# Full passes over at least this many entities use the columnar path; below
+# it the per-row path is as fast and allocates less.
+COLUMNAR_MIN_ENTITIES = 10_000
+
+_COLUMNS = ("s", "p", "o")
+
+
+def available() -> bool:
+    return np is not None
+
+
+def use_columnar(n_entities: int) -> bool:
+    return np is not None and n_entities >= COLUMNAR_MIN_ENTITIES
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "memory.semantic.columnar needs numpy (pip install numpy); "
+            "without it consolidate() and coherence use the per-row path"
+        )
+
+
+def _uuid4_strings(n: int) -> List[str]:
+    """n random uuid4 strings, formatted like str(uuid.uuid4()), in bulk."""
+    raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    digits = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+    hex32 = np.empty((n, 32), dtype=np.uint8)
+    hex32[:, 0::2] = digits[raw >> 4]
+    hex32[:, 1::2] = digits[raw & 0x0F]
+    out = np.full((n, 36), ord("-"), dtype=np.uint8)
+    # 8-4-4-4-12 groups: (hex offset, output offset, width)
+    groups = ((0, 0, 8), (8, 9, 4), (12, 14, 4), (16, 19, 4), (20, 24, 12))
+    for src, dst, width in groups:
+        out[:, dst:dst + width] = hex32[:, src:src + width]
+    text = out.tobytes().decode("ascii")
+    return [text[i:i + 36] for i in range(0, 36 * n, 36)]
+
+
+def _column(a, dtype) -> "np.ndarray":
+    # copy out of the array.array: a live numpy view would export its
+    # buffer and block SemanticMemory from appending rows
+    return np.frombuffer(a, dtype=dtype).copy() if len(a) else np.empty(0, dtype)
+
+
+class FactColumns:
+    """
+    Point-in-time numpy copy of a SemanticMemory's columns: subject,
+    predicate and object term ids (int64) and confidence (float64), row
+    for row. Bulk checks run as array operations over all facts at once.
+
+    The copy does not follow later writes to the memory; take a new one
+    after writing (bulk_upsert only needs one taken before it runs).
+    """
+
+    def __init__(self, sm: SemanticMemory):
+        _require_numpy()
+        self.terms = sm._terms
+        self.s = _column(sm._s, np.int64)
+        self.p = _column(sm._p, np.int64)
+        self.o = _column(sm._o, np.int64)
+        self.conf = _column(sm._conf, np.float64)
+        # (p, o) -> (subjects sorted, their rows); built on first use
+        self._by_po: Dict[Tuple[int, int], Tuple["np.ndarray", "np.ndarray"]] = {}
+
+    def __len__(self) -> int:
+        return len(self.s)
+
+    def term_ids(self, strings: Sequence[str]) -> "np.ndarray":
+        """Term id per string; -1 where the term was never interned."""
+        return np.fromiter(
+            map(self.terms.get, strings, repeat(-1)),
+            dtype=np.int64,
+            count=len(strings),
+        )
+
+    def _subjects(self, p: int, o: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        hit = self._by_po.get((p, o))
+        if hit is None:
+            rows = np.flatnonzero((self.p == p) & (self.o == o))
+            rows = rows[np.argsort(self.s[rows], kind="stable")]
+            hit = (self.s[rows], rows)
+            self._by_po[(p, o)] = hit
+        return hit
+
+    def _lookup(self, subjects: "np.ndarray", p: int, o: int) -> "np.ndarray":
+        out = np.full(len(subjects), -1, dtype=np.int64)
+        keys, rows = self._subjects(p, o)
+        if not len(keys) or not len(subjects):
+            return out
+        pos = np.minimum(np.searchsorted(keys, subjects), len(keys) - 1)
+        found = keys[pos] == subjects  # -1 (unknown term) never matches
+        out[found] = rows[pos[found]]
+        return out
+
+    def lookup(
+        self, subjects: "np.ndarray", predicate: str, object: str
+    ) -> "np.ndarray":
+        """Row of (subject, predicate, object) per subject term id; -1 if absent."""
+        p = self.terms.get(predicate)
+        o = self.terms.get(object)
+        if p is None or o is None:
+            return np.full(len(subjects), -1, dtype=np.int64)
+        return self._lookup(np.asarray(subjects, dtype=np.int64), p, o)
+
+    def has(self, subjects: "np.ndarray", predicate: str, object: str) -> "np.ndarray":
+        """Set membership: does (subject, predicate, object) exist, per subject."""
+        return self.lookup(subjects, predicate, object) >= 0
+
+    def contains(
+        self, subjects: "np.ndarray", predicates: "np.ndarray", objects: "np.ndarray"
+    ) -> "np.ndarray":
+        """Membership of arbitrary triples (term-id arrays), one pass per (p, o)."""
+        s = np.asarray(subjects, dtype=np.int64)
+        p = np.asarray(predicates, dtype=np.int64)
+        o = np.asarray(objects, dtype=np.int64)
+        out = np.zeros(len(s), dtype=bool)
+        if not len(s):
+            return out
+        for pi, oi in np.unique(np.stack([p, o]), axis=1).T.tolist():
+            if pi < 0 or oi < 0:
+                continue
+            sel = np.flatnonzero((p == pi) & (o == oi))
+            out[sel] = self._lookup(s[sel], pi, oi) >= 0
+        return out
+
+    def count_by(self, column: str = "p") -> Dict[str, int]:
+        """Facts per distinct term of column "s", "p" or "o" (group-by count)."""
+        if column not in _COLUMNS:
+            raise ValueError(f"Invalid column '{column}'")
+        values, counts = np.unique(getattr(self, column), return_counts=True)
+        strings = self.terms.strings
+        return {strings[v]: c for v, c in zip(values.tolist(), counts.tolist())}
+
+
+def bulk_upsert(
+    sm: SemanticMemory,
+    subjects: Sequence[str],
+    predicate: str,
+    object: str,
+    confidence: Union[float, Sequence[float]] = 1.0,
+    columns: Optional[FactColumns] = None,
+) -> "np.ndarray":
+    """
+    SemanticMemory.upsert_fact for many subjects sharing one (predicate,
+    object). Existing triples take max(old, new) confidence in one array
+    operation; missing ones are appended in input order, in one bulk
+    extend of the columns and indexes. Returns a mask of subjects whose
+    fact was added or strengthened.
+
+    columns, if given, must be a FactColumns of sm taken before any write
+    that could add these triples (it can be shared by several calls).
+    """
+    cols = columns if columns is not None else FactColumns(sm)
+    n = len(subjects)
+    conf = np.broadcast_to(np.asarray(confidence, dtype=np.float64), (n,))
+    rows = cols.lookup(cols.term_ids(subjects), predicate, object)
+
+    changed = np.zeros(n, dtype=bool)
+    found = np.flatnonzero(rows >= 0)
+    if len(found):
+        live = np.frombuffer(sm._conf, dtype=np.float64)  # writable view
+        r, c = rows[found], conf[found]
+        changed[found] = c > live[r]
+        np.maximum.at(live, r, c)
+        del live  # release the buffer before any append
+        sm._dirty.update(dict.fromkeys(r[changed[found]].tolist()))
+
+    missing = np.flatnonzero(rows < 0).tolist()
+    if not missing:
+        return changed
+    new_subjects = [subjects[i] for i in missing]
+    if len(set(new_subjects)) < len(new_subjects):
+        # repeated subjects merge into their first row: take the row path
+        for i in missing:
+            _, changed[i] = sm.upsert_fact(
+                subjects[i], predicate, object, float(conf[i])
+            )
+        return changed
+    sm._extend(
+        _uuid4_strings(len(missing)),
+        new_subjects,
+        predicate,
+        object,
+        array("d", conf[missing].tobytes()),
+    )
+    changed[missing] = True
+    return changed
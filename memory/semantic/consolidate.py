@@ -1,40 +1,86 @@
-from typing import List
+from typing import Iterable, List, Optional
+from memory.semantic.columnar import FactColumns, bulk_upsert, use_columnar
 from memory.semantic.memory import SemanticMemory
-from memory.semantic.facts import Fact
-from world.model import WorldModel
+from world.model import EntityRef, WorldDelta, WorldModel
 
 
-def _upsert(sm: SemanticMemory, fact: Fact) -> str:
-    existing = sm.find_facts(
-        subject=fact.subject, predicate=fact.predicate, object=fact.object
-    )
+def _consolidate_entity(
+    sm: SemanticMemory, e: EntityRef, project_id: Optional[str], notes: List[str]
+):
+    # Persons
+    if e.type == "person":
+        _, changed = sm.upsert_fact(e.id, "is_a", "person")
+        if changed:
+            notes.append(f"fact: {e.name} is_a person")
 
-    if existing:
-        f = existing[0]
-        f.confidence = max(f.confidence, fact.confidence)
-        return f.id
+    # Files + part_of Project-Ordis
+    elif e.type == "file":
+        _, changed = sm.upsert_fact(e.id, "is_a", "file")
+        if changed:
+            notes.append(f"fact: {e.name} is_a file")
 
-    return sm.add_fact(fact)
+        if project_id:
+            _, changed = sm.upsert_fact(e.id, "part_of", project_id)
+            if changed:
+                notes.append(f"fact: {e.name} part_of Project-Ordis")
 
 
-def consolidate(wm: WorldModel, sm: SemanticMemory) -> List[str]:
-    notes: List[str] = []
+def _consolidate_columnar(
+    wm: WorldModel, sm: SemanticMemory, project_id: Optional[str]
+) -> List[str]:
+    """
+    Full pass as one bulk upsert per rule. Same facts and notes (in the same
+    order) as the per-entity pass; new file facts are appended rule by rule
+    rather than entity by entity.
+    """
+    cols = FactColumns(sm)
+    persons = wm.find_entity_ids(type="person")
+    files = wm.find_entity_ids(type="file")
+    person_new = bulk_upsert(sm, persons, "is_a", "person", columns=cols)
+    file_new = bulk_upsert(sm, files, "is_a", "file", columns=cols)
+    part_new = None
+    touched = file_new
+    if project_id:
+        part_new = bulk_upsert(sm, files, "part_of", project_id, columns=cols)
+        touched = file_new | part_new
 
-    # Persons
-    for p in wm.find_entities(type="person"):
-        _upsert(sm, Fact(subject=p.id, predicate="is_a", object="person"))
-        notes.append(f"fact: {p.name} is_a person")
+    # names in find_entity_ids() order, so row i of each mask is names[i]
+    names = wm.find_entity_names(type="person")
+    notes = [f"fact: {names[i]} is_a person" for i in person_new.nonzero()[0].tolist()]
+    names = wm.find_entity_names(type="file")
+    for i in touched.nonzero()[0].tolist():
+        if file_new[i]:
+            notes.append(f"fact: {names[i]} is_a file")
+        if part_new is not None and part_new[i]:
+            notes.append(f"fact: {names[i]} part_of Project-Ordis")
+    return notes
 
-    # Files + part_of Project-Ordis
-    projects = wm.find_entities(type="project", name="Project-Ordis")
+
+def consolidate(
+    wm: WorldModel, sm: SemanticMemory, delta: Optional[WorldDelta] = None
+) -> List[str]:
+    """
+    Derive facts from the world. With a delta, only entities touched since the
+    last run are visited; without one (or delta.full) the whole world is.
+    Returns notes for facts that were actually added or strengthened.
+    """
+    notes: List[str] = []
+
+    projects = wm.find_entity_refs(type="project", name="Project-Ordis")
     project_id = projects[0].id if projects else None
 
-    for f in wm.find_entities(type="file"):
-        _upsert(sm, Fact(subject=f.id, predicate="is_a", object="file"))
-        notes.append(f"fact: {f.name} is_a file")
+    entities: Iterable[Optional[EntityRef]]
+    if delta is None or delta.full or (project_id and project_id in delta.entities):
+        # a new/changed project affects the part_of fact of every file
+        if use_columnar(len(wm.entities)):
+            return _consolidate_columnar(wm, sm, project_id)
+        persons = wm.find_entity_refs(type="person")
+        entities = persons + wm.find_entity_refs(type="file")
+    else:
+        entities = map(wm.get_entity_ref, delta.entities)
 
-        if project_id:
-            _upsert(sm, Fact(subject=f.id, predicate="part_of", object=project_id))
-            notes.append(f"fact: {f.name} part_of Project-Ordis")
+    for e in entities:
+        if e is not None:
+            _consolidate_entity(sm, e, project_id, notes)
 
     return notes
@@ -1,17 +1,365 @@
 import json
+import os
+import uuid
+from array import array
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from memory.atomic_io import atomic_write_text
+from memory.symbols import RecordView, SymbolTable
 from .facts import Fact
 
 SEMANTIC_STATE_PATH = Path(__file__).parent / "semantic_state.json"
+# Append-only journal of new/strengthened facts, replayed on top of the
+# snapshot at load time.
+SEMANTIC_JOURNAL_PATH = Path(__file__).parent / "semantic_state.journal.jsonl"
+# Compact (rewrite snapshot, truncate journal) once the journal holds at least
+# this many records AND more records than the store has facts.
+SEMANTIC_JOURNAL_COMPACT_MIN_RECORDS = 10_000
+
+# Term ids are packed into one int key per triple: predicate and object ids
+# must stay below 2**32 (subjects are unbounded).
+_TERM_BITS = 32
+
+
+def _pack(s: int, p: int, o: int) -> int:
+    return (((s << _TERM_BITS) | p) << _TERM_BITS) | o
+
+
+# Index buckets are rows in insertion order: a bare int while a key has one
+# row (most subjects), an array of raw int64s from the second row on.
+_Bucket = Union[int, array]
+
+
+def _bucket_add(index: Dict[int, _Bucket], key: int, row: int):
+    bucket = index.get(key)
+    if bucket is None:
+        index[key] = row
+    elif type(bucket) is int:
+        index[key] = array("q", (bucket, row))
+    else:
+        bucket.append(row)
+
+
+def _bucket_extend(index: Dict[int, _Bucket], key: int, rows: array):
+    bucket = index.get(key)
+    if bucket is None:
+        index[key] = array("q", rows)
+    elif type(bucket) is int:
+        index[key] = array("q", (bucket,)) + rows
+    else:
+        bucket.extend(rows)
+
+
+def _bucket_rows(index: Dict[int, _Bucket], key: int) -> Sequence[int]:
+    bucket = index.get(key, ())
+    return (bucket,) if type(bucket) is int else bucket
+
+
+def _model(cls, data: Dict):
+    """API model from an internal row (see world.model._model)."""
+    if hasattr(cls, "model_validate"):
+        return cls.model_validate(data)
+    return cls.construct(**data)
+
+
+class FactFeed:
+    """
+    Per-consumer record of fact subjects touched since the last drain. A new
+    feed starts in 'full' state so its first drain triggers one complete pass.
+    """
 
-class SemanticMemory:
     def __init__(self):
-        self.facts: Dict[str, Fact] = {}
+        self.full = True
+        self.subjects: Dict[str, None] = {}
+
+    def __bool__(self) -> bool:
+        return self.full or bool(self.subjects)
+
+    def drain(self) -> Tuple[bool, List[str]]:
+        out = (self.full, list(self.subjects))
+        self.full = False
+        self.subjects = {}
+        return out
+
+
+class SemanticMemory:
+    """
+    Fact store, one row per unique (subject, predicate, object) triple.
+
+    Facts are held as parallel columns (term ids and confidence in flat
+    arrays) rather than one object per fact: subject/predicate/object
+    strings are interned once in a term table, the fact uuid maps to its
+    row, and the indexes hold rows. Fact models exist only at the API
+    (built on access) and persistence boundaries; `facts` is a read-only
+    view. Facts are never removed, so a row is also its fact's surrogate id.
+    """
+
+    def __init__(
+        self,
+        state_path: Optional[Path] = SEMANTIC_STATE_PATH,
+        journal_path: Optional[Path] = SEMANTIC_JOURNAL_PATH,
+    ):
+        # state_path None => purely in-memory: save()/compact() write nothing;
+        # journal_path None => every save() rewrites the snapshot
+        self.state_path = state_path
+        self.journal_path = journal_path
+        self._feeds: List[FactFeed] = []
+
+        self._fact_ids = SymbolTable()  # fact uuid <-> row
+        self._terms = SymbolTable()  # subject/predicate/object strings
+        self._s = array("q")
+        self._p = array("q")
+        self._o = array("q")
+        self._conf = array("d")
+        self._evidence: Dict[int, List[int]] = {}  # row -> episode ids (sparse)
+        self.facts: Mapping[str, Fact] = RecordView(self._fact_ids, None, self._fact)
+
+        # triple indexes over term ids, maintained by _append
+        self._triples: Dict[int, int] = {}  # packed (s, p, o) -> row
+        self._by_s: Dict[int, _Bucket] = {}
+        self._by_p: Dict[int, _Bucket] = {}
+        self._by_o: Dict[int, _Bucket] = {}
+
+        # persistence: rows from _saved_rows on were added since the last
+        # save(); _dirty holds older rows strengthened since. _persisted:
+        # whether the files hold this store's state (see WorldModel.save)
+        self._saved_rows = 0
+        self._dirty: Dict[int, None] = {}
+        self._journal_records = 0
+        self._persisted = False
+        self.bytes_written = 0  # cumulative, for tick I/O metrics
+
+    def open_change_feed(self) -> FactFeed:
+        feed = FactFeed()
+        self._feeds.append(feed)
+        return feed
+
+    # ---- rows <-> models ----
+    def _fact_dict(self, row: int) -> Dict[str, Any]:
+        terms = self._terms.strings
+        evidence = self._evidence.get(row)
+        return {
+            "id": self._fact_ids.strings[row],
+            "subject": terms[self._s[row]],
+            "predicate": terms[self._p[row]],
+            "object": terms[self._o[row]],
+            "confidence": self._conf[row],
+            "evidence_ids": list(evidence) if evidence is not None else None,
+        }
+
+    def _fact(self, row: int) -> Fact:
+        return _model(Fact, self._fact_dict(row))
+
+    # ---- writes ----
+    def _append(
+        self,
+        fact_id: str,
+        s: int,
+        p: int,
+        o: int,
+        key: int,
+        confidence: float,
+        evidence_ids: Optional[List[int]],
+    ) -> int:
+        if fact_id in self._fact_ids:
+            raise ValueError(f"Fact id '{fact_id}' already used by another triple")
+        row = self._fact_ids.intern(fact_id)
+        self._s.append(s)
+        self._p.append(p)
+        self._o.append(o)
+        self._conf.append(confidence)
+        if evidence_ids is not None:
+            self._evidence[row] = list(evidence_ids)
+        self._triples[key] = row
+        _bucket_add(self._by_s, s, row)
+        _bucket_add(self._by_p, p, row)
+        _bucket_add(self._by_o, o, row)
+        if self._feeds:
+            subject = self._terms.strings[s]
+            for feed in self._feeds:
+                feed.subjects[subject] = None
+        return row
+
+    def _extend(
+        self,
+        fact_ids: Sequence[str],
+        subjects: Sequence[str],
+        predicate: str,
+        object: str,
+        confidence: array,
+    ) -> range:
+        """
+        Bulk _append of new facts sharing one (predicate, object): every
+        column, index and feed is extended in one pass instead of per row.
+        The caller guarantees distinct subjects, fresh fact ids and that
+        none of the triples exists yet. Returns the new rows.
+        """
+        n = len(subjects)
+        terms = self._terms
+        p, o = terms.intern(predicate), terms.intern(object)
+        new_terms = [s for s in subjects if s not in terms]
+        if new_terms:
+            first = len(terms.strings)
+            terms.update(zip(new_terms, range(first, first + len(new_terms))))
+            terms.strings.extend(new_terms)
+        s_ids = array("q", map(terms.__getitem__, subjects))
+
+        start = len(self._s)
+        rows = range(start, start + n)
+        fact_rows = self._fact_ids
+        fact_rows.update(zip(fact_ids, rows))
+        fact_rows.strings.extend(fact_ids)
+        self._s.extend(s_ids)
+        self._p.extend(array("q", (p,)) * n)
+        self._o.extend(array("q", (o,)) * n)
+        self._conf.extend(confidence)
+
+        po = (p << _TERM_BITS) | o
+        shift = 2 * _TERM_BITS
+        self._triples.update(zip([(s << shift) | po for s in s_ids], rows))
+        row_ids = array("q", rows)
+        _bucket_extend(self._by_p, p, row_ids)
+        _bucket_extend(self._by_o, o, row_ids)
+        by_s = self._by_s
+        if by_s.keys().isdisjoint(s_ids):
+            by_s.update(zip(s_ids, rows))
+        else:
+            # _bucket_add inlined: this is the per-row part of a bulk append
+            get = by_s.get
+            for s, row in zip(s_ids, rows):
+                bucket = get(s)
+                if bucket is None:
+                    by_s[s] = row
+                elif type(bucket) is int:
+                    by_s[s] = array("q", (bucket, row))
+                else:
+                    bucket.append(row)
+        if self._feeds:
+            touched = dict.fromkeys(subjects)
+            for feed in self._feeds:
+                feed.subjects.update(touched)
+        return rows
+
+    def _add(
+        self,
+        fact_id: str,
+        subject: str,
+        predicate: str,
+        object: str,
+        confidence: float,
+        evidence_ids: Optional[List[int]],
+    ) -> str:
+        terms = self._terms
+        s, p, o = terms.intern(subject), terms.intern(predicate), terms.intern(object)
+        key = _pack(s, p, o)
+        row = self._triples.get(key)
+        if row is None:
+            self._append(fact_id, s, p, o, key, confidence, evidence_ids)
+            return fact_id
+
+        if confidence > self._conf[row]:
+            self._conf[row] = confidence
+            self._dirty[row] = None
+        if evidence_ids:
+            merged = self._evidence.setdefault(row, [])
+            new = [i for i in evidence_ids if i not in merged]
+            if new:
+                merged.extend(new)
+                self._dirty[row] = None
+        return self._fact_ids.strings[row]
 
     def add_fact(self, f: Fact) -> str:
-        self.facts[f.id] = f
-        return f.id
+        """
+        Add a fact. Triples are unique: adding an existing (s, p, o) merges
+        confidence (max) and evidence into the stored fact and returns its id.
+        """
+        return self._add(
+            f.id, f.subject, f.predicate, f.object, f.confidence, f.evidence_ids
+        )
+
+    def upsert_fact(
+        self, subject: str, predicate: str, object: str, confidence: float = 1.0
+    ) -> Tuple[str, bool]:
+        """
+        Create the triple or raise its confidence to `confidence` if higher.
+        Returns (fact id, whether memory changed).
+        """
+        terms = self._terms
+        s, p, o = terms.intern(subject), terms.intern(predicate), terms.intern(object)
+        key = _pack(s, p, o)
+        row = self._triples.get(key)
+        if row is None:
+            fact_id = str(uuid.uuid4())
+            self._append(fact_id, s, p, o, key, confidence, None)
+            return fact_id, True
+        if confidence > self._conf[row]:
+            self._conf[row] = confidence
+            self._dirty[row] = None
+            return self._fact_ids.strings[row], True
+        return self._fact_ids.strings[row], False
+
+    # ---- queries ----
+    def _triple_row(self, subject: str, predicate: str, object: str) -> Optional[int]:
+        get = self._terms.get
+        s, p, o = get(subject), get(predicate), get(object)
+        if s is None or p is None or o is None:
+            return None
+        # _pack() inlined: this is the hot path of every coherence check
+        return self._triples.get((((s << _TERM_BITS) | p) << _TERM_BITS) | o)
+
+    def _match_rows(
+        self,
+        subject: Optional[str],
+        predicate: Optional[str],
+        object: Optional[str],
+    ) -> Iterator[int]:
+        """Rows matching any combination of bound/unbound terms."""
+        terms = self._terms
+        s = p = o = None
+        if subject:
+            s = terms.get(subject)
+            if s is None:
+                return
+        if predicate:
+            p = terms.get(predicate)
+            if p is None:
+                return
+        if object:
+            o = terms.get(object)
+            if o is None:
+                return
+
+        if s is not None and p is not None and o is not None:
+            row = self._triples.get(_pack(s, p, o))
+            if row is not None:
+                yield row
+        elif s is not None and p is not None:
+            col = self._p
+            yield from (r for r in _bucket_rows(self._by_s, s) if col[r] == p)
+        elif p is not None and o is not None:
+            col = self._p
+            yield from (r for r in _bucket_rows(self._by_o, o) if col[r] == p)
+        elif o is not None and s is not None:
+            col = self._o
+            yield from (r for r in _bucket_rows(self._by_s, s) if col[r] == o)
+        elif s is not None:
+            yield from _bucket_rows(self._by_s, s)
+        elif p is not None:
+            yield from _bucket_rows(self._by_p, p)
+        elif o is not None:
+            yield from _bucket_rows(self._by_o, o)
+        else:
+            yield from range(len(self._s))
 
     def find_facts(
         self,
@@ -19,29 +367,139 @@ class SemanticMemory:
         predicate: Optional[str] = None,
         object: Optional[str] = None
     ) -> List[Fact]:
-        out = list(self.facts.values())
-        if subject:
-            out = [x for x in out if x.subject == subject]
-        if predicate:
-            out = [x for x in out if x.predicate == predicate]
-        if object:
-            out = [x for x in out if x.object == object]
-        return out
+        return [self._fact(r) for r in self._match_rows(subject, predicate, object)]
+
+    def get_fact(self, subject: str, predicate: str, object: str) -> Optional[Fact]:
+        """The fact for an exact triple, or None."""
+        row = self._triple_row(subject, predicate, object)
+        return self._fact(row) if row is not None else None
+
+    def exists(
+        self,
+        subject: Optional[str] = None,
+        predicate: Optional[str] = None,
+        object: Optional[str] = None
+    ) -> bool:
+        """True if at least one fact matches; stops at the first hit."""
+        if subject and predicate and object:
+            return self._triple_row(subject, predicate, object) is not None
+        return next(self._match_rows(subject, predicate, object), None) is not None
+
+    # ---- persistence ----
+    def snapshot(self) -> List[Dict]:
+        """All facts as written to the state file (and to checkpoints)."""
+        return [self._fact_dict(r) for r in range(len(self._s))]
 
     def save(self):
-        data = [
-            f.model_dump() if hasattr(f, "model_dump") else f.dict()
-            for f in self.facts.values()
+        """
+        Append facts added or strengthened since the last save to the
+        journal; compact when large. A store that was not load()ed (or has
+        no journal) writes a fresh snapshot instead.
+        """
+        if self.state_path is None:
+            self._mark_saved()
+            return
+        if not self._persisted or self.journal_path is None:
+            self.compact()
+            return
+        saved = self._saved_rows
+        rows = [r for r in self._dirty if r < saved]
+        rows.extend(range(saved, len(self._s)))
+        if not rows:
+            return
+
+        lines = [
+            json.dumps({"op": "fact", "data": self._fact_dict(r)}) for r in rows
         ]
-        SEMANTIC_STATE_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        with open(self.journal_path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self.bytes_written += len(data)
+        self._mark_saved()
+        self._journal_records += len(lines)
+
+        if self._journal_records >= max(
+            SEMANTIC_JOURNAL_COMPACT_MIN_RECORDS, len(self._s)
+        ):
+            self.compact()
+
+    def _mark_saved(self):
+        self._saved_rows = len(self._s)
+        self._dirty = {}
+
+    def compact(self):
+        """Atomically write a full snapshot and truncate the journal."""
+        self._mark_saved()
+        self._journal_records = 0
+        self._persisted = True
+        if self.state_path is None:
+            return
+        self.bytes_written += atomic_write_text(
+            self.state_path, json.dumps(self.snapshot())
+        )
+        # journal records only raise confidence / add evidence, so replaying
+        # one already contained in the snapshot is harmless
+        if self.journal_path is not None:
+            with open(self.journal_path, "w", encoding="utf-8") as f:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _load_fact(self, d: Dict[str, Any]):
+        # persisted rows are our own output: no pydantic model per fact
+        self._add(
+            d["id"],
+            d["subject"],
+            d["predicate"],
+            d["object"],
+            d.get("confidence", 1.0),
+            d.get("evidence_ids"),
+        )
 
     @classmethod
-    def load(cls):
-        sm = cls()
-        if not SEMANTIC_STATE_PATH.exists():
-            return sm
-        raw = json.loads(SEMANTIC_STATE_PATH.read_text(encoding="utf-8"))
+    def from_snapshot(
+        cls,
+        raw: List[Dict],
+        state_path: Optional[Path] = SEMANTIC_STATE_PATH,
+        journal_path: Optional[Path] = SEMANTIC_JOURNAL_PATH,
+    ):
+        """Build a store from snapshot() data; call compact() to persist it."""
+        sm = cls(state_path, journal_path)
         for d in raw:
-            f = Fact(**d)
-            sm.facts[f.id] = f
-        return sm
\ No newline at end of file
+            sm._load_fact(d)
+        sm._mark_saved()
+        return sm
+
+    @classmethod
+    def load(
+        cls,
+        state_path: Optional[Path] = SEMANTIC_STATE_PATH,
+        journal_path: Optional[Path] = SEMANTIC_JOURNAL_PATH,
+    ):
+        sm = cls(state_path, journal_path)
+        if state_path is not None and state_path.exists():
+            for d in json.loads(state_path.read_text(encoding="utf-8")):
+                sm._load_fact(d)
+
+        if journal_path is not None and journal_path.exists():
+            good_bytes = 0
+            with open(journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except json.JSONDecodeError:
+                        rec = None
+                    if rec is None or not line.endswith(b"\n"):
+                        # torn tail from a crash mid-append
+                        with open(journal_path, "r+b") as w:
+                            w.truncate(good_bytes)
+                        break
+                    if rec.get("op") == "fact":
+                        sm._load_fact(rec["data"])
+                    sm._journal_records += 1
+                    good_bytes += len(line)
+
+        sm._mark_saved()
+        sm._persisted = True
+        return sm
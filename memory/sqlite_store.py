@@ -39,5 +39,25 @@ def init_sqlite(conn):
         created_at TEXT NOT NULL
     )
     """)
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_health_metrics_tick ON health_metrics(tick_id)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_health_metrics_name "
+        "ON health_metrics(metric_name, metric_value)"
+    )
+    # rows past retention, downsampled per metric and time bucket
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS health_metrics_rollup (
+        metric_name TEXT NOT NULL,
+        bucket_start TEXT NOT NULL,
+        bucket_seconds INTEGER NOT NULL,
+        count INTEGER NOT NULL,
+        min REAL NOT NULL,
+        mean REAL NOT NULL,
+        max REAL NOT NULL,
+        PRIMARY KEY (metric_name, bucket_start)
+    )
+    """)
 
     conn.commit()
\ No newline at end of file
@@ -0,0 +1,68 @@
+from typing import Any, Callable, Iterator, List, Mapping, Optional
+
+
+class SymbolTable(dict):
+    """
+    Dense integer surrogates for strings (uuids, terms): a str -> id dict
+    plus the reverse list `strings`. intern() hands out the next id the
+    first time a string is seen. Ids are never reused, so they can index
+    parallel arrays. Lookups are plain dict/list access (hot paths).
+    """
+
+    __slots__ = ("strings",)
+
+    def __init__(self):
+        super().__init__()
+        self.strings: List[str] = []
+
+    def intern(self, s: str) -> int:
+        i = self.get(s)
+        if i is None:
+            i = len(self.strings)
+            self[s] = i
+            self.strings.append(s)
+        return i
+
+
+class RecordView(Mapping):
+    """
+    Read-only uuid -> pydantic model mapping over compact internal rows.
+
+    Models are built on access and are snapshots: mutating one does not
+    change the store (use the store's update methods). rows holds the live
+    surrogate ids; None means every interned id is live (append-only stores).
+    """
+
+    def __init__(
+        self,
+        ids: SymbolTable,
+        rows: Optional[Mapping[int, Any]],
+        build: Callable[[int], Any],
+    ):
+        self._ids = ids
+        self._rows = rows
+        self._build = build
+
+    def _row(self, key: object) -> Optional[int]:
+        i = self._ids.get(key) if isinstance(key, str) else None
+        if i is None or (self._rows is not None and i not in self._rows):
+            return None
+        return i
+
+    def __getitem__(self, key: str):
+        i = self._row(key)
+        if i is None:
+            raise KeyError(key)
+        return self._build(i)
+
+    def __contains__(self, key: object) -> bool:
+        return self._row(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        if self._rows is None:
+            return iter(self._ids)
+        strings = self._ids.strings
+        return (strings[i] for i in self._rows)
+
+    def __len__(self) -> int:
+        return len(self._ids) if self._rows is None else len(self._rows)
@@ -1,37 +1,192 @@
+import codecs
+import json
+import os
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+from memory.atomic_io import atomic_write_text
 from .events import Event
 
 INBOX_DIR = Path(__file__).parent / "inbox"
 PROCESSED_DIR = INBOX_DIR / "processed"
+# Resume points of partially streamed files (one json per file name)
+OFFSETS_DIR = INBOX_DIR / "offsets"
 SUPPORTED_EXT = {".md", ".txt"}
 
+# Files up to this size are ingested as a single event with inline content;
+# larger files are streamed as a sequence of chunk events of this size.
+INBOX_INLINE_MAX_BYTES = 256 * 1024
+INBOX_CHUNK_BYTES = 256 * 1024
+
 # Ensure folders exist
 INBOX_DIR.mkdir(parents=True, exist_ok=True)
 PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+OFFSETS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def scan_inbox() -> List[Event]:
-    events: List[Event] = []
-    for p in INBOX_DIR.glob("*"):
-        if p.suffix.lower() not in SUPPORTED_EXT:
-            continue
+def _mark_processed(p: Path):
+    # Mark as processed to avoid re‑ingest on next scan
+    dest = PROCESSED_DIR / p.name
+    try:
+        p.replace(dest)
+    except Exception:
+        # If move fails, fall back to leaving it in place
+        pass
+    _offset_path(p).unlink(missing_ok=True)
+
+
+def _offset_path(p: Path) -> Path:
+    return OFFSETS_DIR / (p.name + ".json")
+
+
+def _load_offset(p: Path, st: os.stat_result) -> Tuple[int, int]:
+    """(byte offset, chunk index) to resume p at; (0, 0) unless p is unchanged."""
+    try:
+        saved = json.loads(_offset_path(p).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0, 0
+    if saved.get("size") != st.st_size or saved.get("mtime_ns") != st.st_mtime_ns:
+        return 0, 0  # a different file under the same name
+    return saved["offset"], saved["chunk"]
+
 
+def _save_offset(p: Path, st: os.stat_result, offset: int, chunk: int):
+    atomic_write_text(
+        _offset_path(p),
+        json.dumps(
+            {
+                "offset": offset,
+                "chunk": chunk,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+            }
+        ),
+    )
+
+
+def iter_file_events(p: Path) -> Iterator[Event]:
+    """
+    Stream one inbox file as events, reading at most INBOX_CHUNK_BYTES at a
+    time. Small files produce one event shaped as before; large files produce
+    chunk events carrying chunk/offset/size/final in the payload.
+
+    Progress is recorded as each event is handed out, before the yield: the
+    file is moved to processed/ with its last event, and a large file's
+    resume point is saved with each earlier chunk. A consumer that stops
+    early (closed at shutdown, or at a take() boundary) therefore never sees
+    an event twice; a partially streamed file continues after its last
+    handed-out chunk on the next scan.
+    """
+    st = p.stat()
+    size = st.st_size
+    meta = {"ext": p.suffix.lower()}
+
+    if size <= INBOX_INLINE_MAX_BYTES:
         text = p.read_text(encoding="utf-8", errors="ignore")
-        events.append(
-            Event(
+        _mark_processed(p)
+        yield Event(
+            event_type="file",
+            source="inbox_scan",
+            payload={"path": str(p), "name": p.name, "content": text},
+            meta=meta,
+        )
+        return
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    offset, chunk = _load_offset(p, st)
+    with open(p, "rb") as f:
+        f.seek(offset)
+        while True:
+            data = f.read(INBOX_CHUNK_BYTES)
+            final = len(data) < INBOX_CHUNK_BYTES or offset + len(data) >= size
+            text = decoder.decode(data, final=final)
+            ev = Event(
                 event_type="file",
                 source="inbox_scan",
-                payload={"path": str(p), "name": p.name, "content": text},
-                meta={"ext": p.suffix.lower()},
+                payload={
+                    "path": str(p),
+                    "name": p.name,
+                    "content": text,
+                    "chunk": chunk,
+                    "offset": offset,
+                    "size": size,
+                    "final": final,
+                },
+                meta=meta,
             )
-        )
+            if final:
+                break
+            offset += len(data)
+            chunk += 1
+            # resume before any partial utf-8 sequence the decoder holds back
+            pending = len(decoder.getstate()[0])
+            _save_offset(p, st, offset - pending, chunk)
+            yield ev
+    _mark_processed(p)  # closed first: an open file may not be movable
+    yield ev
+
+
+def iter_inbox_events(paths: Iterable[Path]) -> Iterator[Event]:
+    for p in paths:
+        if p.suffix.lower() not in SUPPORTED_EXT or not p.is_file():
+            continue
+        yield from iter_file_events(p)
+
+
+def scan_inbox(max_files: Optional[int] = None) -> List[Event]:
+    """One-shot scan of the inbox; max_files bounds how many files are taken."""
+    paths = [
+        p for p in sorted(INBOX_DIR.glob("*")) if p.suffix.lower() in SUPPORTED_EXT
+    ]
+    if max_files is not None:
+        paths = paths[:max_files]
+    return list(iter_inbox_events(paths))
+
+
+class InboxStream:
+    """
+    Pull-based ingest over a sequence of inbox files. Events are handed out
+    a bounded number at a time and the current file's chunk generator is
+    kept between calls, so a large file is read and queued a few chunks per
+    tick instead of all at once.
+    """
+
+    def __init__(self, paths: Iterable[Path] = ()):
+        self._paths: Deque[Path] = deque(paths)
+        self._current: Optional[Iterator[Event]] = None
+
+    def __bool__(self) -> bool:
+        return self._current is not None or bool(self._paths)
+
+    def add(self, paths: Iterable[Path]):
+        self._paths.extend(paths)
+
+    def next_event(self) -> Optional[Event]:
+        """The next event, opening the next file as needed; None when done."""
+        while True:
+            if self._current is None:
+                if not self._paths:
+                    return None
+                self._current = iter_inbox_events([self._paths.popleft()])
+            ev = next(self._current, None)
+            if ev is not None:
+                return ev
+            self._current = None  # file exhausted (and moved to processed/)
+
+    def take(self, max_events: int) -> List[Event]:
+        out: List[Event] = []
+        while len(out) < max_events:
+            ev = self.next_event()
+            if ev is None:
+                break
+            out.append(ev)
+        return out
 
-        # Mark as processed to avoid re‑ingest on next scan
-        dest = PROCESSED_DIR / p.name
-        try:
-            p.replace(dest)
-        except Exception:
-            # If move fails, fall back to leaving it in place
-            pass
-    return events
+    def close(self):
+        """
+        Close the file being streamed. It stays in the inbox and resumes
+        after its last handed-out chunk on the next scan.
+        """
+        if self._current is not None:
+            self._current.close()
+            self._current = None
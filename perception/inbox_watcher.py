@@ -0,0 +1,183 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from .file_ingest import INBOX_DIR, SUPPORTED_EXT
+
+# Polling fallback: rescan interval while waiting
+POLL_INTERVAL_SECONDS = 0.25
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _is_candidate(p: Path) -> bool:
+    return p.suffix.lower() in SUPPORTED_EXT
+
+
+class InboxWatcher(ABC):
+    """
+    Yields inbox files as they land. Ready paths are queued internally;
+    poll() hands out at most max_files of them so callers can bound
+    per-tick ingest and leave the rest for later ticks. Subclasses supply
+    how new files are noticed (_collect) and waited for (wait).
+    """
+
+    def __init__(self, inbox_dir: Path = INBOX_DIR):
+        self.inbox_dir = Path(inbox_dir)
+        self._ready: Dict[Path, None] = {}  # ordered set
+        # files already sitting in the inbox when we start
+        for p in sorted(self.inbox_dir.iterdir()):
+            if p.is_file() and _is_candidate(p):
+                self._ready[p] = None
+
+    def has_pending(self) -> bool:
+        self._collect()
+        return bool(self._ready)
+
+    def poll(self, max_files: Optional[int] = None) -> List[Path]:
+        """Return up to max_files ready paths without blocking."""
+        self._collect()
+        out: List[Path] = []
+        for p in list(self._ready):
+            if max_files is not None and len(out) >= max_files:
+                break
+            del self._ready[p]
+            if p.exists():
+                out.append(p)
+        return out
+
+    @abstractmethod
+    def wait(self, timeout: float) -> bool:
+        """Block until a file is ready or timeout elapses. True if ready."""
+
+    def close(self):
+        pass
+
+    @abstractmethod
+    def _collect(self):
+        """Move newly landed files into the ready set without blocking."""
+
+
+class InotifyWatcher(InboxWatcher):
+    """Linux inotify watcher: files are reported on close-after-write or move-in."""
+
+    def __init__(self, inbox_dir: Path = INBOX_DIR):
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify not available")
+
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(
+            self._fd,
+            os.fsencode(str(inbox_dir)),
+            _IN_CLOSE_WRITE | _IN_MOVED_TO,
+        )
+        if wd < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+        # watch first, then list: a file landing in between is seen twice at
+        # worst, and poll() drops duplicates/moved files.
+        super().__init__(inbox_dir)
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def _collect(self):
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            if not buf:
+                return
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+                if mask & _IN_ISDIR or not name:
+                    continue
+                p = self.inbox_dir / os.fsdecode(name)
+                if _is_candidate(p):
+                    self._ready[p] = None
+
+    def wait(self, timeout: float) -> bool:
+        if self.has_pending():
+            return True
+        r, _, _ = select.select([self._fd], [], [], timeout)
+        return bool(r) and self.has_pending()
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher(InboxWatcher):
+    """
+    Portable fallback. A file is reported once its (size, mtime) is unchanged
+    between two scans, so half-written files are not picked up.
+    """
+
+    def __init__(
+        self, inbox_dir: Path = INBOX_DIR, interval: float = POLL_INTERVAL_SECONDS
+    ):
+        self.interval = interval
+        self._seen: Dict[Path, Tuple[int, float]] = {}
+        self._reported: Dict[Path, None] = {}
+        super().__init__(inbox_dir)
+        self._reported.update(self._ready)
+
+    def _collect(self):
+        current: Dict[Path, Tuple[int, float]] = {}
+        with os.scandir(self.inbox_dir) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                p = Path(entry.path)
+                if not _is_candidate(p):
+                    continue
+                st = entry.stat()
+                sig = (st.st_size, st.st_mtime)
+                current[p] = sig
+                if p not in self._reported and self._seen.get(p) == sig:
+                    self._ready[p] = None
+                    self._reported[p] = None
+        self._seen = current
+        # forget files that left the inbox so a re-drop is reported again
+        for p in list(self._reported):
+            if p not in current:
+                del self._reported[p]
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.has_pending():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.interval, remaining))
+
+
+def make_inbox_watcher(inbox_dir: Path = INBOX_DIR) -> InboxWatcher:
+    """inotify where available, polling everywhere else."""
+    try:
+        return InotifyWatcher(inbox_dir)
+    except (OSError, AttributeError):
+        return PollingWatcher(inbox_dir)
@@ -1,9 +1,9 @@
 from .events import Event
 
-def ingest_chat(text: str, user_id: str = "operator") -> Event:
+def ingest_chat(text: str, user_id: str = "operator", channel: str = "cli") -> Event:
     return Event(
         event_type="chat",
         source=user_id,
         payload={"text": text},
-        meta={"channel": "cli"}
+        meta={"channel": channel}
     )
\ No newline at end of file
@@ -0,0 +1,26 @@
+from kernel.kernel import Kernel
+
+
+def main():
+    k = Kernel()
+    try:
+        before = len(k.world.relations)
+        removed = k.world.compact_relations()
+        # rewrite the snapshot so the duplicates are gone from disk, not
+        # just tombstoned in the journal
+        k.world.compact()
+        k.log_episode(
+            "world_compaction",
+            {"relations_before": before, "duplicates_removed": removed},
+        )
+        # the compaction is not on the tape: checkpoint it, or the next start
+        # restores the previous checkpoint and replays the duplicates back
+        k.run_consolidation()
+        k.maybe_checkpoint(force=True)
+        print(f"Removed {removed} duplicate relations ({before} -> {before - removed}).")
+    finally:
+        k.shutdown()
+
+
+if __name__ == "__main__":
+    main()
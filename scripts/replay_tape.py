@@ -0,0 +1,53 @@
+import argparse
+
+from kernel.checkpoint import rebuild_from_tape, state_digest
+from kernel.kernel import Kernel
+
+
+def verify(k: Kernel) -> bool:
+    """Replay the whole tape in memory and compare it with the live state."""
+    k.episodes.flush()
+    world, semantic, stats = rebuild_from_tape(k.episodic)
+    live = state_digest(k.world, k.semantic)
+    replayed = state_digest(world, semantic)
+    ok = True
+    for key in ("entities", "relations", "facts"):
+        missing = set(map(repr, replayed[key])) - set(map(repr, live[key]))
+        extra = set(map(repr, live[key])) - set(map(repr, replayed[key]))
+        if missing or extra:
+            ok = False
+            print(
+                f"{key}: {len(missing)} missing from live state, "
+                f"{len(extra)} not on tape"
+            )
+            for item in sorted(missing)[:5]:
+                print(f"  - {item}")
+            for item in sorted(extra)[:5]:
+                print(f"  + {item}")
+    verdict = "state matches the tape." if ok else "state diverges from the tape."
+    print(f"Replayed {stats.events} events in {stats.seconds:.2f}s: {verdict}")
+    return ok
+
+
+def main(rebuild: bool = False, check: bool = False, checkpoint: bool = False):
+    k = Kernel()
+    try:
+        if rebuild:
+            stats = k.rebuild_from_tape()
+            print(f"Rebuilt state from {stats.events} events in {stats.seconds:.2f}s.")
+        if check:
+            verify(k)
+        if checkpoint:
+            ckpt = k.maybe_checkpoint(force=True)
+            print(f"Wrote {ckpt.path}" if ckpt else "Nothing new to checkpoint.")
+    finally:
+        k.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild or verify state from the tape.")
+    parser.add_argument("--rebuild", action="store_true", help="replay into live state")
+    parser.add_argument("--verify", action="store_true", help="compare state to a replay")
+    parser.add_argument("--checkpoint", action="store_true", help="checkpoint now")
+    args = parser.parse_args()
+    main(rebuild=args.rebuild, check=args.verify, checkpoint=args.checkpoint)
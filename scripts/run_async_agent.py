@@ -0,0 +1,63 @@
+import argparse
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+from kernel.async_runtime import (
+    AsyncRuntime,
+    inbox_source,
+    socket_chat_source,
+    stdin_chat_source,
+)
+from kernel.kernel import Kernel
+from perception.inbox_watcher import make_inbox_watcher
+
+
+async def _run(
+    socket_path: Optional[Path],
+    stdin: bool,
+    rate_hz: Optional[float],
+    max_ticks: Optional[int],
+):
+    k = Kernel()
+    watcher = make_inbox_watcher()
+    try:
+        rt = AsyncRuntime(k, rate_hz=rate_hz)
+        rt.add_source(inbox_source(watcher))
+        if stdin:
+            rt.add_source(stdin_chat_source())
+        if socket_path is not None:
+            rt.add_source(socket_chat_source(socket_path))
+        stats = await rt.run(max_ticks=max_ticks)
+        print(stats.summary())
+    finally:
+        watcher.close()
+        k.shutdown()
+
+
+def main(
+    socket_path: Optional[Path] = None,
+    stdin: bool = False,
+    rate_hz: Optional[float] = None,
+    max_ticks: Optional[int] = None,
+):
+    """Serve the inbox plus optional stdin/unix-socket chat from one process."""
+    try:
+        asyncio.run(_run(socket_path, stdin, rate_hz, max_ticks))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Ordis on an asyncio loop.")
+    parser.add_argument("--socket", type=Path, help="unix socket for chat lines")
+    parser.add_argument("--stdin", action="store_true", help="read chat from stdin")
+    parser.add_argument("--rate-hz", type=float, help="fixed tick rate")
+    parser.add_argument("--max-ticks", type=int, help="stop after N ticks")
+    args = parser.parse_args()
+    main(
+        socket_path=args.socket,
+        stdin=args.stdin,
+        rate_hz=args.rate_hz,
+        max_ticks=args.max_ticks,
+    )
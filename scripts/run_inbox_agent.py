@@ -1,29 +1,45 @@
-import time
 from kernel.kernel import Kernel
-from perception.file_ingest import scan_inbox
+from perception.file_ingest import InboxStream
+from perception.inbox_watcher import make_inbox_watcher
+
+# Bound per-tick ingest; remaining files are picked up on later ticks.
+MAX_FILES_PER_TICK = 100
+# Events (whole small files or chunks of large ones) queued per tick; a large
+# file is resumed on the next tick where it left off.
+MAX_EVENTS_PER_TICK = 100
 
 
 def main(poll_seconds: int = 5, max_ticks: int | None = None):
     k = Kernel()
+    watcher = make_inbox_watcher()
+    stream = InboxStream()
     ticks = 0
     try:
         while True:
-            # 1) perceive
-            events = scan_inbox()
-
-            # 2) enqueue into kernel
-            for e in events:
+            # 1) perceive + enqueue into kernel, never more events than the
+            #    kernel queue has room for
+            if not stream:
+                stream.add(watcher.poll(max_files=MAX_FILES_PER_TICK))
+            free = k.queue_free_slots()
+            budget = MAX_EVENTS_PER_TICK
+            if free is not None:
+                budget = min(budget, free)
+            for e in stream.take(budget):
                 k.ingest_event(e)
 
-            # 3) run one deterministic tick
+            # 2) run one deterministic tick
             k.step()
             ticks += 1
 
             if max_ticks is not None and ticks >= max_ticks:
                 break
 
-            time.sleep(poll_seconds)
+            # 3) heartbeat at least every poll_seconds, sooner when files land
+            if not stream and not watcher.has_pending():
+                watcher.wait(poll_seconds)
     finally:
+        stream.close()
+        watcher.close()
         k.shutdown()
 
 
@@ -0,0 +1,79 @@
+import argparse
+import sqlite3
+from typing import Dict, List
+from kernel.kernel import EPISODIC_DB_PATH
+
+
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    idx = min(len(sorted_vals) - 1, int(round(q * (len(sorted_vals) - 1))))
+    return sorted_vals[idx]
+
+
+def main(last: int = 1000, top: int = 10, db: str = str(EPISODIC_DB_PATH)):
+    """Print per-metric percentiles over the last N ticks and the slowest ticks."""
+    conn = sqlite3.connect(db)
+    try:
+        tick_ids = [
+            row[0]
+            for row in conn.execute(
+                "SELECT tick_id FROM health_metrics WHERE metric_name='tick.seconds' "
+                "ORDER BY id DESC LIMIT ?",
+                (last,),
+            )
+        ]
+        if not tick_ids:
+            print("No tick metrics recorded yet.")
+            return
+
+        values: Dict[str, List[float]] = {}
+        # chunk the IN (...) list to stay under SQLite's variable limit
+        for i in range(0, len(tick_ids), 500):
+            chunk = tick_ids[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            for name, value in conn.execute(
+                f"SELECT metric_name, metric_value FROM health_metrics "
+                f"WHERE tick_id IN ({marks})",
+                chunk,
+            ):
+                values.setdefault(name, []).append(value)
+
+        print(f"Last {len(tick_ids)} ticks")
+        print(f"{'metric':<32}{'n':>7}{'p50':>12}{'p90':>12}{'p99':>12}{'max':>12}")
+        for name in sorted(values):
+            vals = sorted(values[name])
+            print(
+                f"{name:<32}{len(vals):>7}"
+                f"{_percentile(vals, 0.5):>12.4g}{_percentile(vals, 0.9):>12.4g}"
+                f"{_percentile(vals, 0.99):>12.4g}{vals[-1]:>12.4g}"
+            )
+
+        print(f"\nSlowest {top} ticks")
+        rows = conn.execute(
+            "SELECT tick_id, metric_value, status FROM health_metrics "
+            "WHERE metric_name='tick.seconds' ORDER BY metric_value DESC LIMIT ?",
+            (top,),
+        ).fetchall()
+        for tick_id, secs, status in rows:
+            phases = conn.execute(
+                "SELECT metric_name, metric_value FROM health_metrics "
+                "WHERE tick_id=? AND metric_name LIKE '%.seconds' "
+                "AND metric_name != 'tick.seconds' ORDER BY metric_value DESC LIMIT 3",
+                (tick_id,),
+            ).fetchall()
+            breakdown = ", ".join(
+                f"{n[:-len('.seconds')]}={v:.4f}s" for n, v in phases
+            )
+            print(f"{tick_id}  {secs:.4f}s  {status}  [{breakdown}]")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize per-tick health metrics.")
+    parser.add_argument("--last", type=int, default=1000, help="ticks to summarize")
+    parser.add_argument("--top", type=int, default=10, help="slowest ticks to list")
+    parser.add_argument("--db", default=str(EPISODIC_DB_PATH), help="episodic db")
+    args = parser.parse_args()
+    main(last=args.last, top=args.top, db=args.db)
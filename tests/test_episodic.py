@@ -0,0 +1,29 @@
+from kernel.config import KernelConfig
+from kernel.kernel import Kernel
+from memory.blob_store import BLOB_INLINE_MAX_BYTES, BLOB_REF_KEY
+from perception.events import Event
+
+
+def test_search_finds_text_inside_blob():
+    k = Kernel(KernelConfig.in_memory())
+    try:
+        content = "filler text\n" * (BLOB_INLINE_MAX_BYTES // 8) + "zanzibarquartz\n"
+        k.ingest_event(
+            Event(
+                event_type="file",
+                source="inbox_scan",
+                payload={"name": "big.txt", "path": "/x/big.txt", "content": content},
+            )
+        )
+        k.log_episode("chat", {"text": "nothing to see here"})
+        k.episodes.flush()
+
+        hits = k.episodic.search("zanzibarquartz")
+        assert [e.event_type for e in hits] == ["file"]
+        # the tape itself only holds a reference to the content
+        assert BLOB_REF_KEY in hits[0].payload["payload"]["content"]
+        # payload and blob text match together
+        assert len(k.episodic.search("big AND zanzibarquartz")) == 1
+        assert k.episodic.search("nothing") and not k.episodic.search("zzznope")
+    finally:
+        k.shutdown()
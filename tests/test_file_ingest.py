@@ -0,0 +1,47 @@
+import pytest
+
+from perception import file_ingest
+from perception.file_ingest import InboxStream
+
+
+@pytest.fixture
+def inbox(tmp_path, monkeypatch):
+    processed, offsets = tmp_path / "processed", tmp_path / "offsets"
+    processed.mkdir()
+    offsets.mkdir()
+    monkeypatch.setattr(file_ingest, "PROCESSED_DIR", processed)
+    monkeypatch.setattr(file_ingest, "OFFSETS_DIR", offsets)
+    return tmp_path
+
+
+def test_close_after_last_event_marks_file_processed(inbox):
+    p = inbox / "note.txt"
+    p.write_text("hello", encoding="utf-8")
+
+    stream = InboxStream([p])
+    (ev,) = stream.take(1)
+    stream.close()  # e.g. shutdown right after the file's only event
+
+    assert ev.payload["content"] == "hello"
+    assert not p.exists()
+    assert (inbox / "processed" / "note.txt").exists()
+    assert not InboxStream(inbox.glob("*.txt")).take(10)
+
+
+def test_partially_streamed_file_resumes_after_last_chunk(inbox, monkeypatch):
+    monkeypatch.setattr(file_ingest, "INBOX_INLINE_MAX_BYTES", 8)
+    monkeypatch.setattr(file_ingest, "INBOX_CHUNK_BYTES", 7)
+    text = "abécd€ef" * 5  # multi-byte characters straddle chunks
+    p = inbox / "big.txt"
+    p.write_text(text, encoding="utf-8")
+
+    stream = InboxStream([p])
+    first = stream.take(2)
+    stream.close()
+    assert p.exists()
+
+    rest = InboxStream([p]).take(100)
+    events = first + rest
+    assert [e.payload["chunk"] for e in events] == list(range(len(events)))
+    assert "".join(e.payload["content"] for e in events) == text
+    assert rest[-1].payload["final"] and not p.exists()
@@ -0,0 +1,22 @@
+from kernel.config import KernelConfig
+from kernel.kernel import Kernel
+from world.model import Entity, WorldModel
+
+
+def test_fresh_lazy_kernel_consolidates_before_eval(tmp_path):
+    # persisted world that was never consolidated, no checkpoint yet
+    cfg = KernelConfig.at(tmp_path)
+    wm = WorldModel(cfg.world_state_path, cfg.world_journal_path)
+    wm.add_entity(Entity(type="person", name="alice"))
+    wm.add_entity(Entity(type="file", name="notes.txt"))
+    wm.save()
+
+    k = Kernel(cfg)
+    try:
+        assert k._world is None  # nothing hydrated before the first tick
+        for _ in range(3):
+            k.step()
+        assert not k.safe_mode
+        assert len(k.semantic.facts) >= 2
+    finally:
+        k.shutdown()
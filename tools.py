@@ -1,4 +1,11 @@
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Optional
+
+from kernel.executor import (
+    EXEC_MODES,
+    EXECUTOR_DEFAULT_TIMEOUT_SECONDS,
+    ExecMode,
+    Executor,
+)
 
 ToolFn = Callable[[Dict[str, Any]], Dict[str, Any]]
 
@@ -6,14 +13,44 @@ class ToolRouter:
     """
     Week-1 stub. No smart selection.
     Just a registry so the kernel can call tools later.
+
+    Tools are registered with an execution mode: "inline" tools run on the
+    caller's thread via call(); "io"/"cpu"/"async" tools go through submit(),
+    which queues them on the executor and returns a job id. The kernel
+    ingests their results as events on a later tick. call() on an async
+    tool returns its coroutine for the caller to await.
     """
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None):
         self.tools: Dict[str, ToolFn] = {}
+        self.modes: Dict[str, ExecMode] = {}
+        self.executor = executor
 
-    def register(self, name: str, fn: ToolFn):
+    def register(self, name: str, fn: ToolFn, mode: ExecMode = "inline"):
+        if mode not in EXEC_MODES:
+            raise ValueError(f"Invalid tool mode '{mode}'")
         self.tools[name] = fn
+        self.modes[name] = mode
 
-    def call(self, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    def _get(self, name: str) -> ToolFn:
         if name not in self.tools:
             raise ValueError(f"Tool '{name}' not registered")
-        return self.tools[name](args)
\ No newline at end of file
+        return self.tools[name]
+
+    def call(self, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a tool synchronously, whatever its mode."""
+        return self._get(name)(args)
+
+    def submit(
+        self,
+        name: str,
+        args: Dict[str, Any],
+        timeout: Optional[float] = EXECUTOR_DEFAULT_TIMEOUT_SECONDS,
+    ) -> int:
+        """Queue an off-thread/async tool on the executor. Returns the job id."""
+        fn = self._get(name)
+        mode = self.modes[name]
+        if mode == "inline":
+            raise ValueError(f"Tool '{name}' is inline; use call()")
+        if self.executor is None:
+            raise ValueError("ToolRouter has no executor")
+        return self.executor.submit("tool", name, fn, args, mode=mode, timeout=timeout)
@@ -1,7 +1,6 @@
 from typing import List
 from world.model import WorldModel
 from world.entities import Entity
-from world.relations import Relation
 from perception.events import Event
 
 def apply_event(wm: WorldModel, event: Event) -> List[str]:
@@ -12,24 +11,26 @@ def apply_event(wm: WorldModel, event: Event) -> List[str]:
     notes: List[str] = []
 
     # Ensure Project-Ordis exists
-    projects = wm.find_entities(type="project", name="Project-Ordis")
+    projects = wm.find_entity_refs(type="project", name="Project-Ordis")
     if projects:
         project = projects[0]
     else:
         project_id = wm.add_entity(Entity(type="project", name="Project-Ordis"))
-        project = wm.entities[project_id]
+        project = wm.get_entity_ref(project_id)
         notes.append("created project: Project-Ordis")
 
     # Rule: chat event implies operator person exists
     if event.event_type == "chat":
-        persons = wm.find_entities(type="person", name=event.source)
+        persons = wm.find_entity_refs(type="person", name=event.source)
         if not persons:
             pid = wm.add_entity(Entity(type="person", name=event.source))
             notes.append(f"created person: {event.source}")
         return notes
 
-    # Rule: file event creates/updates File entity and links to Project-Ordis
-    if event.event_type == "file":
+    # Rule: file event creates/updates File entity and links to Project-Ordis.
+    # A streamed file updates the world once, on its first chunk; later
+    # chunks only carry content.
+    if event.event_type == "file" and not event.payload.get("chunk"):
         file_name = event.payload.get("name", "unknown_file")
         file_path = event.payload.get("path")
 
@@ -37,11 +38,11 @@ def apply_event(wm: WorldModel, event: Event) -> List[str]:
         if existing:
             f_ent = existing[0]
             # update meta deterministically
-            meta = f_ent.meta or {}
+            meta = dict(f_ent.meta or {})
             if file_path:
                 meta["path"] = file_path
-            f_ent.meta = meta
-            notes.append(f"updated file: {file_name}")
+            if wm.set_entity_meta(f_ent.id, meta):
+                notes.append(f"updated file: {file_name}")
         else:
             fid = wm.add_entity(Entity(
                 type="file",
@@ -51,13 +52,14 @@ def apply_event(wm: WorldModel, event: Event) -> List[str]:
             f_ent = wm.entities[fid]
             notes.append(f"created file: {file_name}")
 
-        # link file -> project
-        wm.add_relation(Relation(
+        # link file -> project (idempotent: one part_of edge per file)
+        _, changed = wm.upsert_relation(
             type="part_of",
             src=f_ent.id,
             dst=project.id,
             confidence=1.0
-        ))
-        notes.append(f"linked file '{file_name}' -> Project-Ordis")
+        )
+        if changed:
+            notes.append(f"linked file '{file_name}' -> Project-Ordis")
 
     return notes
\ No newline at end of file